@@ -7,6 +7,7 @@ All specialized agents inherit from BaseAgent, which provides:
 - Retry logic for malformed responses
 """
 
+import asyncio
 from dataclasses import dataclass, field
 
 from llm.client import OllamaClient, OllamaClientError, OllamaResponseError
@@ -116,6 +117,9 @@ class BaseAgent:
         # Truncate history if needed
         self._truncate_history()
 
+        # Prior turns (excluding the current message), built once for all retries
+        history = self._get_history_as_dicts()[:-1]
+
         last_error: Exception | None = None
         for _attempt in range(self.max_retries):
             try:
@@ -123,7 +127,7 @@ class BaseAgent:
                 response = self.client.chat(
                     message=message,
                     system_prompt=self.system_prompt,
-                    conversation_history=self._get_history_as_dicts()[:-1],  # Exclude current msg
+                    conversation_history=history,
                 )
 
                 # Validate response
@@ -157,6 +161,20 @@ class BaseAgent:
             f"Last error: {last_error}"
         )
 
+    async def achat(self, message: str) -> str:
+        """Async variant of chat; runs it in a worker thread.
+
+        Args:
+            message: The user message to send.
+
+        Returns:
+            The assistant's response text.
+
+        Raises:
+            OllamaClientError: If all retries fail or a non-recoverable error occurs.
+        """
+        return await asyncio.to_thread(self.chat, message)
+
     def clear_history(self) -> None:
         """Clear the conversation history."""
         self.conversation_history.clear()
@@ -167,7 +185,8 @@ class BaseAgent:
         Returns:
             A string summarizing the conversation (message count and estimated tokens).
         """
-        total_tokens = sum(self._estimate_tokens(msg.content) for msg in self.conversation_history)
+        # Same per-message estimate as _estimate_tokens, without a call per message
+        total_tokens = sum(len(msg.content) // CHARS_PER_TOKEN for msg in self.conversation_history)
         return (
             f"Agent '{self.name}': {len(self.conversation_history)} messages, "
             f"~{total_tokens} tokens"
@@ -46,6 +46,9 @@ class UserStory:
     title: str
     description: str
     acceptance_criteria: list[str] = field(default_factory=list)
+    # IDs of stories that must pass before this one is started; None if the
+    # story doesn't declare any (prd.json files from the converter don't)
+    dependencies: list[str] | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UserStory":
@@ -62,6 +65,7 @@ class UserStory:
             title=data.get("title", ""),
             description=data.get("description", ""),
             acceptance_criteria=data.get("acceptanceCriteria", []),
+            dependencies=data.get("dependencies"),
         )
 
     def to_prompt(self) -> str:
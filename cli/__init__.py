@@ -3,6 +3,15 @@
 Provides command-line interface for MAT operations.
 """
 
-from cli.main import app
+from typing import Any
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so the cli.fast entry point doesn't import Typer
+    if name == "app":
+        from cli.main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
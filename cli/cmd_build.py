@@ -0,0 +1,121 @@
+"""`mat build`: run the Ralph build loop."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+
+from cli.common import console, ensure_settings, get_prd_path
+
+
+def build(
+    prd_file: Optional[str] = typer.Option(
+        None,
+        "--prd",
+        "-f",
+        help="Path to prd.json file (defaults to prd.json in project root)",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None,
+        "--project-dir",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    max_retries: int = typer.Option(
+        3,
+        "--max-retries",
+        "-r",
+        help="Maximum retry attempts per story",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable verbose output",
+    ),
+) -> None:
+    """Run Ralph build loop.
+
+    This command runs the autonomous build loop which iterates through all
+    user stories in prd.json, implementing and verifying each one.
+
+    The build loop will:
+    1. Load stories from prd.json
+    2. For each story with passes=false: implement, verify, mark complete
+    3. Retry failed stories up to max-retries times
+    4. Auto-commit after each successful story
+    """
+    # Imported here so `mat --help` doesn't load the agent stack
+    from ralph import BuildLoop, BuildLoopError
+    from utils.logger import get_logger, setup_logging
+
+    # Set up logging and config
+    ensure_settings(project_dir)
+
+    setup_logging(verbose=verbose)
+    logger = get_logger()
+
+    # Determine PRD path (absolute, so BuildLoop needn't consult settings for it)
+    prd_path = (Path(prd_file) if prd_file else get_prd_path(project_dir)).absolute()
+
+    console.print("\n[bold blue]MAT Build Loop[/bold blue]\n")
+
+    # Check if prd.json exists
+    if not prd_path.exists():
+        console.print(f"[red]Error:[/red] prd.json not found at {prd_path}")
+        console.print(
+            "[dim]Run 'mat init' to create a project, "
+            "then convert PRD to prd.json[/dim]"
+        )
+        raise typer.Exit(1)
+
+    console.print(f"[dim]Loading PRD from:[/dim] {prd_path}")
+
+    try:
+        # Create and run build loop
+        build_loop = BuildLoop(prd_path=prd_path, max_retries=max_retries)
+        result = build_loop.run()
+
+        # Display results
+        if result.success:
+            console.print("\n[bold green]Build completed successfully![/bold green]")
+        else:
+            console.print("\n[bold yellow]Build finished with issues.[/bold yellow]")
+
+        passed_count = result.completed_stories
+        total_count = result.total_stories
+        console.print(f"[dim]Stories:[/dim] {passed_count}/{total_count} passed")
+
+        if result.failed_story_ids:
+            console.print(f"[red]Failed:[/red] {', '.join(result.failed_story_ids)}")
+
+        if result.errors:
+            console.print(
+                "\n[yellow]Errors:[/yellow]\n"
+                + "\n".join(f"  - {escape(str(error))}" for error in result.errors)
+            )
+
+        # Exit with appropriate code (don't raise, just return for success)
+        if not result.success:
+            raise typer.Exit(1)
+
+    except BuildLoopError as e:
+        logger.error(f"Build loop error: {e}")
+        console.print(f"\n[red]Build Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Build interrupted.[/yellow]")
+        raise typer.Exit(1) from None
+    except typer.Exit:
+        # Re-raise typer exits (don't catch them as generic exceptions)
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        console.print(f"\n[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+def register(app: typer.Typer) -> None:
+    """Add the `build` command to the Typer app."""
+    app.command()(build)
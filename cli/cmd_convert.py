@@ -0,0 +1,101 @@
+"""`mat convert`: convert PRD markdown to prd.json."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from cli.common import console, ensure_settings
+from config import get_settings
+
+
+def convert(
+    prd_file: Optional[str] = typer.Option(
+        None,
+        "--prd",
+        "-f",
+        help="Path to PRD markdown file (defaults to tasks/prd.md)",
+    ),
+    output: Optional[str] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output path for prd.json (defaults to prd.json in project root)",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None,
+        "--project-dir",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable verbose output",
+    ),
+) -> None:
+    """Convert PRD markdown to prd.json for the build loop.
+
+    This command converts a PRD markdown file (typically tasks/prd.md) to the
+    prd.json format required by the Ralph build loop.
+    """
+    # Imported here so `mat --help` doesn't load the workflows package
+    from ralph.build_loop import discard_journal
+    from utils.logger import setup_logging
+    from workflows import PRDToJsonConverter
+
+    # Set up logging and config
+    ensure_settings(project_dir)
+
+    # Without --verbose, logging is configured lazily by the converter's
+    # first get_logger() call
+    if verbose:
+        setup_logging(verbose=True)
+    settings = get_settings()
+
+    console.print("\n[bold blue]MAT PRD Converter[/bold blue]\n")
+
+    # Determine paths
+    if prd_file:
+        input_path = Path(prd_file)
+    else:
+        input_path = Path(settings.project_dir) / "tasks" / "prd.md"
+
+    if output:
+        output_path = Path(output)
+    else:
+        output_path = Path(settings.project_dir) / "prd.json"
+
+    # Check if input exists
+    if not input_path.exists():
+        console.print(f"[red]Error:[/red] PRD not found at {input_path}")
+        console.print("[dim]Run 'mat init' first to create a PRD[/dim]")
+        raise typer.Exit(1)
+
+    console.print(f"[dim]Input:[/dim] {input_path}")
+    console.print(f"[dim]Output:[/dim] {output_path}")
+
+    try:
+        # Convert PRD to JSON
+        converter = PRDToJsonConverter()
+        prd_json = converter.convert(str(input_path), str(output_path))
+        # Passes journaled by an earlier build belong to the old prd.json
+        discard_journal(output_path)
+
+        # Display results
+        story_count = len(prd_json.user_stories)
+        console.print(f"\n[green]Converted successfully![/green]")
+        console.print(f"[dim]Project:[/dim] {prd_json.project}")
+        console.print(f"[dim]Branch:[/dim] {prd_json.branch_name}")
+        console.print(f"[dim]Stories:[/dim] {story_count}")
+        console.print(f"\n[dim]Now run 'mat build' to start the autonomous build loop[/dim]")
+
+    except Exception as e:
+        console.print(f"\n[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+def register(app: typer.Typer) -> None:
+    """Add the `convert` command to the Typer app."""
+    app.command()(convert)
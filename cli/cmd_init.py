@@ -0,0 +1,410 @@
+"""`mat init`: start a new project with a discovery interview."""
+
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import os
+import time
+import urllib.request
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+
+from cli.common import console, ensure_settings
+from config import reload_settings
+
+if TYPE_CHECKING:
+    from workflows import PRDJson
+
+# On-disk cache for the Ollama model list (see _detect_ollama_models_cached)
+MODEL_CACHE_DIR = Path.home() / ".cache" / "mat"
+MODEL_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Contents of the .mat-config written by `mat init`
+_CONFIG_TEMPLATE = (
+    "model={model}\n"
+    "ollama_url={url}\n"
+    "project_dir={project_dir}\n"
+    "timeout=300\n"
+    "verbose=false\n"
+    "max_retries=3\n"
+)
+
+# Marker recording which PRD markdown the current prd.json was converted from
+CONVERT_CACHE_NAME = ".mat-convert-cache.json"
+
+
+def _detect_ollama_models(ollama_url: str = "http://localhost:11434") -> list[str]:
+    """Detect available Ollama models via Ollama's native /api/tags endpoint."""
+    try:
+        with urllib.request.urlopen(f"{ollama_url}/api/tags", timeout=2) as response:
+            data = json.load(response)
+        return [model["name"] for model in data.get("models", [])]
+    except Exception:
+        return []
+
+
+def _detect_ollama_models_cached(
+    ollama_url: str = "http://localhost:11434", refresh: bool = False
+) -> list[str]:
+    """Detect available Ollama models, using a 24h on-disk cache.
+
+    A fresh cache entry is returned without contacting Ollama. Stale (or
+    refreshed) entries are re-fetched, and if Ollama can't be reached the
+    stale list is returned instead. Set MAT_DISABLE_MODEL_CACHE to bypass.
+
+    Args:
+        ollama_url: Base URL of the Ollama server.
+        refresh: Ignore a fresh cache entry and query Ollama.
+    """
+    if os.environ.get("MAT_DISABLE_MODEL_CACHE"):
+        return _detect_ollama_models(ollama_url)
+
+    digest = hashlib.sha1(ollama_url.encode("utf-8")).hexdigest()
+    cache_path = MODEL_CACHE_DIR / f"{digest}.json"
+
+    cached: list[str] = []
+    age: float = MODEL_CACHE_TTL
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        cached = list(json.loads(cache_path.read_text(encoding="utf-8"))["models"])
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = []
+
+    if cached and not refresh and age < MODEL_CACHE_TTL:
+        return cached
+
+    models = _detect_ollama_models(ollama_url)
+    if not models:
+        # Ollama unreachable (or empty) - fall back to the stale list
+        return cached
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"fetched_at": time.time(), "models": models}), encoding="utf-8"
+        )
+    except OSError:
+        pass
+    return models
+
+
+def _create_mat_config(project_dir: Path, model: str, ollama_url: str = "http://localhost:11434") -> Path | None:
+    """Create .mat-config file in project directory.
+
+    Returns the config path if successful, None if permission denied.
+    Falls back to environment variables if file cannot be created.
+    """
+    config_path = project_dir / ".mat-config"
+    config_content = _CONFIG_TEMPLATE.format(
+        model=model, url=ollama_url, project_dir=project_dir
+    )
+    # Leave an identical config untouched so its mtime stays stable
+    try:
+        if config_path.read_text(encoding="utf-8") == config_content:
+            return config_path
+    except OSError:
+        pass
+
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(config_content)
+        os.replace(tmp_path, config_path)
+        return config_path
+    except (PermissionError, OSError):
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        # Fall back to environment variables
+        os.environ["MAT_MODEL"] = model
+        os.environ["MAT_OLLAMA_URL"] = ollama_url
+        os.environ["MAT_PROJECT_DIR"] = str(project_dir)
+        return None
+
+
+def _prd_digest(prd_path: Path) -> dict[str, object]:
+    """Fingerprint PRD markdown for the convert cache.
+
+    Uses a content hash rather than mtime, since save_prd() rewrites the
+    file (and bumps its mtime) on every init even when nothing changed.
+    """
+    data = prd_path.read_bytes()
+    return {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data)}
+
+
+def _convert_prd_cached(
+    prd_md_path: Path, prd_json_path: Path, proj_dir: Path
+) -> "PRDJson":
+    """Convert PRD markdown to prd.json, skipping unchanged input.
+
+    Args:
+        prd_md_path: Path to the PRD markdown.
+        prd_json_path: Path to write prd.json to.
+        proj_dir: Project directory holding the convert cache marker.
+
+    Returns:
+        The converted (or previously converted) PRD, with no story passed.
+    """
+    from ralph.build_loop import discard_journal
+    from workflows import PRDToJsonConverter
+
+    converter = PRDToJsonConverter()
+    cache_path = proj_dir / CONVERT_CACHE_NAME
+    digest = _prd_digest(prd_md_path)
+
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = None
+
+    prd_json: PRDJson | None = None
+    if cached == {"source": str(prd_md_path), **digest} and prd_json_path.exists():
+        # An unreadable prd.json is converted again below
+        with contextlib.suppress(ValueError):
+            prd_json = converter.load_json(str(prd_json_path))
+        # A fresh conversion starts every story over, so a hit must too
+        if prd_json is not None and any(s.passes for s in prd_json.user_stories):
+            for story in prd_json.user_stories:
+                story.passes = False
+            converter.save(str(prd_json_path))
+
+    if prd_json is None:
+        prd_json = converter.convert(str(prd_md_path), str(prd_json_path))
+        with contextlib.suppress(OSError):
+            cache_path.write_text(
+                json.dumps({"source": str(prd_md_path), **digest}), encoding="utf-8"
+            )
+
+    # Passes journaled by an earlier build would be replayed onto prd.json
+    with contextlib.suppress(OSError):
+        discard_journal(prd_json_path)
+    return prd_json
+
+
+def _select_model(models: list[str]) -> str:
+    """Let user select a model from available options."""
+    console.print("\n[bold]Available Ollama models:[/bold]")
+    for i, model in enumerate(models, 1):
+        console.print(f"  {i}. {model}")
+
+    while True:
+        try:
+            choice = typer.prompt("\nSelect model number", default="1")
+            idx = int(choice) - 1
+            if 0 <= idx < len(models):
+                return models[idx]
+            console.print("[red]Invalid selection. Try again.[/red]")
+        except ValueError:
+            console.print("[red]Please enter a number.[/red]")
+
+
+def init(
+    project_dir: Optional[str] = typer.Option(
+        None,
+        "--project-dir",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable verbose output",
+    ),
+    skip_build: bool = typer.Option(
+        False,
+        "--skip-build",
+        help="Skip the build step after PRD generation",
+    ),
+    model: Optional[str] = typer.Option(
+        None,
+        "--model",
+        "-m",
+        help="Ollama model to use (auto-detected if not specified)",
+    ),
+    project_name: Optional[str] = typer.Option(
+        None,
+        "--project-name",
+        "-n",
+        envvar="MAT_PROJECT_NAME",
+        help="Project name (prompted for if not specified)",
+    ),
+) -> None:
+    """Start a new project with discovery interview.
+
+    This command runs the full MAT workflow:
+    1. Detect and select Ollama model
+    2. Create .mat-config
+    3. Run discovery interview
+    4. Generate PRD
+    5. Convert PRD to prd.json
+    6. Optionally start the build loop
+    """
+    # Imported here so `mat --help` doesn't load the agent stack
+    from ralph import BuildLoop
+    from utils.logger import get_logger, setup_logging
+    from workflows import PRDGenerator
+
+    # Determine project directory
+    proj_dir = Path(project_dir) if project_dir else Path.cwd()
+
+    # Set up logging and config
+    ensure_settings(project_dir)
+
+    # Step 1 (started early): detect Ollama models in the background while
+    # logging is set up and the banner printed
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        models_future = executor.submit(_detect_ollama_models_cached)
+
+        setup_logging(verbose=verbose)
+        logger = get_logger()
+
+        console.print("\n[bold blue]MAT Project Initialization[/bold blue]\n")
+        console.print("[dim]Detecting Ollama models...[/dim]")
+
+    try:
+        models = models_future.result()
+        if model and model not in models:
+            # Cached list may predate a recent `ollama pull`
+            models = _detect_ollama_models_cached(refresh=True)
+
+        if not models:
+            console.print("[red]Error:[/red] No Ollama models found.")
+            console.print("[dim]Make sure Ollama is running and has models installed.[/dim]")
+            console.print("[dim]Run: ollama pull codellama[/dim]")
+            raise typer.Exit(1)
+
+        # Step 2: Select model
+        if model and model in models:
+            selected_model = model
+            console.print(f"[dim]Using model:[/dim] {selected_model}")
+        elif model:
+            console.print(f"[yellow]Warning:[/yellow] Model '{model}' not found.")
+            selected_model = _select_model(models)
+        else:
+            selected_model = _select_model(models)
+
+        console.print(f"\n[green]Selected model:[/green] {selected_model}")
+
+        # Step 3: Create .mat-config (or fall back to env vars)
+        config_path = _create_mat_config(proj_dir, selected_model)
+        if config_path:
+            console.print(f"[dim]Created config:[/dim] {config_path}")
+        else:
+            console.print("[dim]Using environment variables for config (no write permission)[/dim]")
+
+        # Pick up the config just written (read from the project dir, not cwd)
+        reload_settings(str(proj_dir))
+
+        # Step 4: Get project name
+        console.print()
+        if project_name:
+            console.print(f"[dim]Project name:[/dim] {project_name}")
+        else:
+            project_name = typer.prompt(
+                "What do you want to name this project? (e.g., 'habit-tracker', 'invoice-app')"
+            )
+        console.print()
+
+        # Step 5: Get initial project description
+        console.print(
+            "[cyan]Tell me about what you want to build.[/cyan]\n"
+            "Describe your idea in a few sentences - what is it, what problem "
+            "does it solve, who is it for?\n"
+        )
+        try:
+            initial_idea = typer.prompt("Your idea")
+        except (KeyboardInterrupt, EOFError):
+            console.print("\n[yellow]Cancelled.[/yellow]")
+            raise typer.Exit(1) from None
+
+        console.print()
+        console.print(
+            "[dim]Great! Now I'll ask a few follow-up questions to understand "
+            "your project better.[/dim]\n"
+        )
+
+        # Step 6: Run discovery interview
+        prd_gen = PRDGenerator()
+        opening_message = prd_gen.start_discovery()
+
+        # Feed the initial idea as the first response
+        response = prd_gen.process_user_input(initial_idea)
+        console.print(f"[cyan]PM Agent:[/cyan] {response}\n")
+
+        # Run remaining interview loop
+        while not prd_gen.is_discovery_complete():
+            try:
+                user_input = typer.prompt("You")
+            except (KeyboardInterrupt, EOFError):
+                console.print("\n[yellow]Interview cancelled.[/yellow]")
+                raise typer.Exit(1) from None
+
+            response = prd_gen.process_user_input(user_input)
+            console.print(f"\n[cyan]PM Agent:[/cyan] {response}\n")
+
+        # Step 7: Generate PRD
+        console.print("\n[bold]Discovery complete![/bold]")
+        console.print("\n[dim]Generating PRD...[/dim]")
+        prd = prd_gen.generate_prd(project_name)
+        saved_path = prd_gen.save_prd()
+
+        console.print(f"\n[green]PRD saved to:[/green] {saved_path}")
+        console.print(f"[green]User stories:[/green] {len(prd.user_stories)}")
+
+        # Step 8: Convert PRD to prd.json
+        console.print("\n[dim]Converting PRD to prd.json...[/dim]")
+        prd_json_path = proj_dir / "prd.json"
+        prd_json = _convert_prd_cached(Path(saved_path), prd_json_path, proj_dir)
+
+        console.print(f"[green]prd.json created:[/green] {prd_json_path}")
+        console.print(f"[dim]Stories ready for build:[/dim] {len(prd_json.user_stories)}")
+
+        # Step 9: Ask about build
+        if skip_build:
+            console.print("\n[dim]Skipping build (--skip-build flag set)[/dim]")
+            console.print("[dim]Run 'mat build' when ready to start the autonomous build loop[/dim]")
+            return
+
+        console.print()
+        start_build = typer.confirm("Start the autonomous build now?", default=True)
+
+        if not start_build:
+            console.print("\n[dim]Run 'mat build' when ready to start the autonomous build loop[/dim]")
+            return
+
+        # Step 10: Run build loop
+        console.print("\n[bold blue]Starting Build Loop[/bold blue]\n")
+        build_loop = BuildLoop(prd_path=prd_json_path, max_retries=3)
+        result = build_loop.run()
+
+        # Display results
+        if result.success:
+            console.print("\n[bold green]Build completed successfully![/bold green]")
+        else:
+            console.print("\n[bold yellow]Build finished with issues.[/bold yellow]")
+
+        console.print(f"[dim]Stories:[/dim] {result.completed_stories}/{result.total_stories} passed")
+
+        if result.failed_story_ids:
+            console.print(f"[red]Failed:[/red] {', '.join(result.failed_story_ids)}")
+
+        if not result.success:
+            raise typer.Exit(1)
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted.[/yellow]")
+        raise typer.Exit(1) from None
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(f"Error during initialization: {e}")
+        console.print(f"\n[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+
+def register(app: typer.Typer) -> None:
+    """Add the `init` command to the Typer app."""
+    app.command()(init)
@@ -0,0 +1,53 @@
+"""`mat status`: show current build progress."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from cli.common import ensure_settings, get_prd_path
+from cli.status import render_status
+
+
+def status(
+    prd_file: Optional[str] = typer.Option(
+        None,
+        "--prd",
+        "-f",
+        help="Path to prd.json file (defaults to prd.json in project root)",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None,
+        "--project-dir",
+        "-p",
+        help="Project directory (defaults to current directory)",
+    ),
+    short: bool = typer.Option(
+        False,
+        "--short",
+        help="Only print a one-line 'X/Y passed' summary",
+    ),
+    rich_table: bool = typer.Option(
+        False,
+        "--rich-table",
+        help="Render stories as a bordered table",
+    ),
+) -> None:
+    """Show current build progress.
+
+    Displays the status of all user stories in prd.json, showing which
+    stories have passed, which are pending, and overall progress.
+    """
+    # Set up config
+    ensure_settings(project_dir)
+
+    # Determine PRD path
+    prd_path = Path(prd_file) if prd_file else get_prd_path(project_dir)
+
+    # Exit with appropriate code
+    raise typer.Exit(render_status(prd_path, short=short, rich_table=rich_table))
+
+
+def register(app: typer.Typer) -> None:
+    """Add the `status` command to the Typer app."""
+    app.command()(status)
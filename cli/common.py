@@ -0,0 +1,49 @@
+"""Shared helpers for MAT CLI commands.
+
+Kept free of Typer so the argparse fast path in cli.fast can use them
+without importing the full command framework.
+"""
+
+from pathlib import Path
+
+from rich.console import Console
+
+from config import get_settings, reload_settings
+
+console = Console()
+
+# Project dir the settings were last loaded for by ensure_settings
+_SETTINGS_KEY: tuple[str | None] | None = None
+
+
+def ensure_settings(project_dir: str | None = None) -> None:
+    """Point settings at a project directory, reloading at most once.
+
+    Repeated calls with the same project_dir are no-ops, so commands can
+    call this unconditionally without re-reading .mat-config each time.
+
+    Args:
+        project_dir: Optional project directory override.
+    """
+    global _SETTINGS_KEY
+    key = (project_dir,)
+    if key == _SETTINGS_KEY:
+        return
+    if project_dir:
+        reload_settings(project_dir)
+    _SETTINGS_KEY = key
+
+
+def get_prd_path(project_dir: str | None = None) -> Path:
+    """Get the path to prd.json.
+
+    Args:
+        project_dir: Optional project directory override.
+
+    Returns:
+        Path to prd.json file.
+    """
+    if project_dir:
+        return Path(project_dir) / "prd.json"
+    settings = get_settings()
+    return Path(settings.project_dir) / "prd.json"
@@ -0,0 +1,84 @@
+"""Console entry point for the MAT CLI.
+
+`mat status`, `mat --help` and a bare `mat` are answered with argparse so
+they don't pay for importing Typer/Click and the agent stack. Every other
+command is handed to the Typer app in cli.main.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# First arguments handled here instead of by Typer
+_FAST_COMMANDS = frozenset({"status", "-h", "--help"})
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argparse parser for the fast-path commands."""
+    parser = argparse.ArgumentParser(
+        prog="mat",
+        description="MAT (Multi-Agent Toolkit) - Local LLM Build Framework",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    # Listed for --help only; these commands are dispatched to Typer
+    subparsers.add_parser("init", help="Start a new project with discovery interview.")
+    subparsers.add_parser("convert", help="Convert PRD markdown to prd.json for the build loop.")
+    subparsers.add_parser("build", help="Run Ralph build loop.")
+
+    status = subparsers.add_parser("status", help="Show current build progress.")
+    status.add_argument(
+        "--prd",
+        "-f",
+        dest="prd_file",
+        default=None,
+        help="Path to prd.json file (defaults to prd.json in project root)",
+    )
+    status.add_argument(
+        "--project-dir",
+        "-p",
+        default=None,
+        help="Project directory (defaults to current directory)",
+    )
+    status.add_argument(
+        "--short",
+        action="store_true",
+        help="Only print a one-line 'X/Y passed' summary",
+    )
+    status.add_argument(
+        "--rich-table",
+        action="store_true",
+        help="Render stories as a bordered table",
+    )
+    return parser
+
+
+def _run_status(args: argparse.Namespace) -> int:
+    """Run `mat status` without going through Typer."""
+    from cli.common import ensure_settings, get_prd_path
+    from cli.status import render_status
+
+    ensure_settings(args.project_dir)
+
+    prd_path = Path(args.prd_file) if args.prd_file else get_prd_path(args.project_dir)
+    return render_status(prd_path, short=args.short, rich_table=args.rich_table)
+
+
+def main() -> None:
+    """Main entry point for the `mat` console script."""
+    argv = sys.argv[1:]
+    if not argv or argv[0] in _FAST_COMMANDS:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if args.command == "status":
+            sys.exit(_run_status(args))
+        parser.print_help()
+        sys.exit(0)
+
+    from cli.main import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
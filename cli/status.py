@@ -0,0 +1,392 @@
+"""Build status rendering for the MAT CLI.
+
+Used by both the Typer `status` command and the argparse fast path in
+cli.fast, so it must not import Typer.
+"""
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterator
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.markup import escape
+
+from cli.common import console
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from rich.table import Table
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # optional speedup, see the "fast" extra
+    ijson = None
+
+# Top-level and per-story fields that `status` displays, keyed by ijson prefix
+_TOP_LEVEL_FIELDS = {"project": "project", "branchName": "branchName"}
+_STORY_FIELDS = {
+    "userStories.item.id": "id",
+    "userStories.item.title": "title",
+    "userStories.item.priority": "priority",
+    "userStories.item.passes": "passes",
+}
+_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
+# Parse cache kept across processes (outside the project tree, so nothing
+# in a cloned repository is ever read back as cache)
+_PARSE_CACHE_DIR = Path.home() / ".cache" / "mat" / "status"
+
+# Sort key for stories without a usable priority (sorted last)
+_PRIORITY_SENTINEL = 999
+
+# Story status labels
+_PASSED = "[green]✓ Passed[/green]"
+_PENDING = "[yellow]○ Pending[/yellow]"
+
+# Progress bar segments, indexed by number of cells (bar is 20 cells wide)
+_FILL = tuple("█" * i for i in range(21))
+_EMPTY = tuple("░" * i for i in range(21))
+
+
+def _iter_prd_stories(
+    events: Iterator[tuple[str, str, object]], header: dict[str, object]
+) -> Iterator[dict[str, object]]:
+    """Yield each story's displayed fields from an ijson event stream.
+
+    Top-level project/branchName values are stored in header as they are
+    passed. Story bodies such as acceptance criteria are skipped by the
+    parser instead of being materialized as Python objects.
+
+    Args:
+        events: ijson.parse() events for the inside of the top-level object.
+        header: Dict that receives the top-level fields.
+
+    Yields:
+        Dicts holding a story's id, title, priority and passes (when set).
+    """
+    story: dict[str, object] | None = None
+    for prefix, event, value in events:
+        if story is not None:
+            if prefix == "userStories.item" and event == "end_map":
+                yield story
+                story = None
+            elif event in _SCALAR_EVENTS and prefix in _STORY_FIELDS:
+                story[_STORY_FIELDS[prefix]] = value
+        elif prefix == "userStories.item" and event == "start_map":
+            story = {}
+        elif event in _SCALAR_EVENTS and prefix in _TOP_LEVEL_FIELDS:
+            header[_TOP_LEVEL_FIELDS[prefix]] = value
+
+
+def _stream_prd_fields(path_str: str) -> dict[str, object] | None:
+    """Incrementally parse only the fields `status` needs from prd.json."""
+    data: dict[str, object] = {}
+    try:
+        with open(path_str, "rb") as f:
+            events = ijson.parse(f, use_float=True)
+            _, event, _ = next(events, ("", None, None))
+            if event != "start_map":
+                return None
+            data["userStories"] = list(_iter_prd_stories(events, data))
+    except (ijson.JSONError, ValueError, OSError):
+        return None
+    return data
+
+
+def _parse_cache_path(path_str: str) -> Path:
+    """Get the parse cache file for a prd.json, keyed by its absolute path."""
+    digest = hashlib.blake2b(
+        os.path.abspath(path_str).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return _PARSE_CACHE_DIR / f"{digest}.json"
+
+
+def _read_parse_cache(path_str: str, key: tuple[int, int, bool]) -> dict[str, object] | None:
+    """Return cached PRD data if the cache was written for this file and key."""
+    try:
+        with open(_parse_cache_path(path_str), "rb") as f:
+            raw = f.read()
+        cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, OSError):
+        # Missing, truncated or not JSON
+        return None
+    if (
+        isinstance(cached, dict)
+        and cached.get("path") == os.path.abspath(path_str)
+        and cached.get("key") == list(key)
+    ):
+        data = cached.get("data")
+        return data if isinstance(data, dict) else None
+    return None
+
+
+def _write_parse_cache(
+    path_str: str, key: tuple[int, int, bool], data: dict[str, object]
+) -> None:
+    """Atomically write the parse cache; failures are ignored."""
+    cache_path = _parse_cache_path(path_str)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    entry = {"path": os.path.abspath(path_str), "key": list(key), "data": data}
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(entry))
+            else:
+                f.write(json.dumps(entry).encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # TypeError/ValueError: data that doesn't round-trip through JSON
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_prd_cached(
+    path_str: str, mtime_ns: int, size: int, fields_only: bool = False
+) -> dict[str, object] | None:
+    """Parse prd.json, memoized on (path, mtime, size).
+
+    Results are also kept across processes as JSON under
+    ~/.cache/mat/status, carrying the same key; set MAT_DISABLE_CACHE to
+    skip it. The returned dict is shared between calls and must not be
+    mutated.
+    """
+    key = (mtime_ns, size, fields_only)
+    use_disk_cache = not os.environ.get("MAT_DISABLE_CACHE")
+    if use_disk_cache:
+        cached = _read_parse_cache(path_str, key)
+        if cached is not None:
+            return cached
+
+    data = _parse_prd(path_str, fields_only)
+    if data is not None and use_disk_cache:
+        _write_parse_cache(path_str, key, data)
+    return data
+
+
+def _parse_prd(path_str: str, fields_only: bool) -> dict[str, object] | None:
+    """Parse prd.json from disk, optionally keeping only displayed fields."""
+    if fields_only and ijson is not None:
+        return _stream_prd_fields(path_str)
+    try:
+        with open(path_str, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, OSError):
+        # ValueError covers json/orjson.JSONDecodeError and bad UTF-8
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _as_str(value: object) -> str:
+    """Return value unchanged if it is already a str, else str(value)."""
+    return value if type(value) is str else str(value)
+
+
+def _priority_key(p: object) -> int:
+    """Get a story priority as int, defaulting to _PRIORITY_SENTINEL."""
+    if isinstance(p, int):
+        return int(p)
+    # The other JSON values int() accepts
+    if isinstance(p, (float, str)):
+        try:
+            return int(p)
+        except (ValueError, OverflowError):
+            pass
+    return _PRIORITY_SENTINEL
+
+
+def _read_journal_ids(prd_path: Path) -> set[str]:
+    """Get the story IDs the build loop has journaled as passed.
+
+    A running build appends passes to prd.journal.jsonl instead of
+    rewriting prd.json (see ralph.build_loop.journal_path), so they aren't
+    in prd.json yet.
+    """
+    try:
+        with open(prd_path.with_suffix(".journal.jsonl"), "rb") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return set()
+    passed: set[str] = set()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get("passes") is True:
+            passed.add(str(entry.get("id")))
+    return passed
+
+
+def _load_prd_data(prd_path: Path, fields_only: bool = False) -> dict[str, object] | None:
+    """Load PRD data from file, including passes journaled by a running build.
+
+    Args:
+        prd_path: Path to prd.json file.
+        fields_only: Only load project, branchName and each story's id,
+            title, priority and passes (streamed when ijson is installed).
+
+    Returns:
+        Parsed PRD data or None if not found.
+    """
+    try:
+        st = prd_path.stat()
+    except OSError:
+        return None
+    data = _load_prd_cached(str(prd_path), st.st_mtime_ns, st.st_size, fields_only)
+    if data is None:
+        return None
+
+    journaled = _read_journal_ids(prd_path)
+    stories = data.get("userStories")
+    if not journaled or not isinstance(stories, list):
+        return data
+    # The cached dict is shared, so overlay onto copies
+    return {
+        **data,
+        "userStories": [
+            {**s, "passes": True} if isinstance(s, dict) and s.get("id") in journaled else s
+            for s in stories
+        ],
+    }
+
+
+def _emit(renderable: "RenderableType") -> None:
+    """Print the status report.
+
+    When stdout isn't a terminal (piped or redirected), the report is
+    rendered to a string first and written with one sys.stdout.write.
+    """
+    if console.is_terminal:
+        console.print(renderable)
+        return
+    with console.capture() as capture:
+        console.print(renderable)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
+
+def _build_story_table(rows: list[tuple[int, str, str, str, bool]]) -> "Table":
+    """Build the Rich story table (rich.table is only imported here)."""
+    from rich.table import Table
+
+    table = Table(title="User Stories")
+    table.add_column("ID", style="cyan")
+    table.add_column("Title", style="white")
+    table.add_column("Priority", justify="right")
+    table.add_column("Status", justify="center")
+
+    add_row = table.add_row
+    for _, story_id, title, priority, passes in rows:
+        add_row(story_id, title, priority, _PASSED if passes else _PENDING)
+
+    return table
+
+
+def render_status(prd_path: Path, short: bool = False, rich_table: bool = False) -> int:
+    """Print the status of all user stories in prd.json.
+
+    Args:
+        prd_path: Path to prd.json file.
+        short: Print a single "X/Y passed" line instead of the full report.
+        rich_table: Render stories as a Rich table instead of plain lines.
+
+    Returns:
+        Exit code: 0 if every story has passed, 1 otherwise.
+    """
+    # Output is collected here and handed to Rich in a single print call
+    lines: list[str] = [] if short else ["", "[bold blue]MAT Build Status[/bold blue]", ""]
+
+    # Check if prd.json exists
+    if not prd_path.exists():
+        lines.append(f"[red]Error:[/red] prd.json not found at {prd_path}")
+        lines.append(
+            "[dim]Run 'mat init' to create a project, then convert PRD to prd.json[/dim]"
+        )
+        _emit("\n".join(lines))
+        return 1
+
+    # Load PRD data
+    prd_data = _load_prd_data(prd_path, fields_only=True)
+    if prd_data is None:
+        lines.append(f"[red]Error:[/red] Could not read prd.json at {prd_path}")
+        _emit("\n".join(lines))
+        return 1
+
+    # Extract information
+    project_name = _as_str(prd_data.get("project", "Unknown Project"))
+    branch_name = _as_str(prd_data.get("branchName", "N/A"))
+    stories_raw = prd_data.get("userStories", [])
+    stories: list[dict[str, object]] = stories_raw if isinstance(stories_raw, list) else []
+
+    # One pass over the stories: (sort key, id, title, priority, passes)
+    rows = [
+        (
+            _priority_key(s.get("priority", _PRIORITY_SENTINEL)),
+            _as_str(s.get("id", "?")),
+            _as_str(s.get("title", "Untitled")),
+            _as_str(s.get("priority", "?")),
+            bool(s.get("passes", False)),
+        )
+        for s in stories
+    ]
+
+    # Calculate stats
+    total = len(rows)
+    passed = sum(1 for row in rows if row[4])
+    pending = total - passed
+
+    if short:
+        # Plain print: no Rich markup or table rendering on this path
+        print(f"{passed}/{total} passed")
+        return 1 if pending > 0 else 0
+
+    # Project info
+    lines.append(f"[bold]Project:[/bold] {project_name}")
+    lines.append(f"[bold]Branch:[/bold] {branch_name}")
+    lines.append(f"[bold]PRD:[/bold] {prd_path}")
+    lines.append("")
+
+    # Progress bar
+    if total > 0:
+        progress_pct = (passed / total) * 100
+        filled = int(progress_pct / 5)  # 20 chars wide
+        bar = f"[green]{_FILL[filled]}[/green]{_EMPTY[20 - filled]}"
+        lines.append(f"Progress: {bar} {progress_pct:.0f}%")
+        lines.append(
+            f"  Passed: [green]{passed}[/green] / Pending: [yellow]{pending}[/yellow]"
+        )
+        lines.append("")
+
+    # Sort by priority; prd.json from the converter is usually already in order
+    if any(rows[i][0] > rows[i + 1][0] for i in range(len(rows) - 1)):
+        rows.sort(key=itemgetter(0))
+
+    if rich_table:
+        from rich.console import Group
+
+        _emit(Group("\n".join(lines), _build_story_table(rows)))
+    else:
+        lines.append("[bold]User Stories[/bold]")
+        append = lines.append
+        for _, story_id, title, priority, passes in rows:
+            append(
+                f"  [cyan]{escape(story_id)}[/cyan]  {escape(title):<40}  "
+                f"{escape(priority):>3}  {_PASSED if passes else _PENDING}"
+            )
+        _emit("\n".join(lines))
+
+    return 1 if pending > 0 else 0
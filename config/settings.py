@@ -7,12 +7,15 @@ Loads configuration from:
 """
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional
 
+# Values accepted as true for boolean settings (compared lowercased)
+_TRUTHY = frozenset({"1", "true", "yes"})
 
-@dataclass
+
+@dataclass(slots=True)
 class Settings:
     """MAT configuration settings."""
 
@@ -22,6 +25,11 @@ class Settings:
     verbose: bool = False
     max_retries: int = 3
     timeout: int = 120
+    max_parallel_agents: int = 4
+    keep_alive: str = "30m"
+    ollama_parallel_slots: int = 4
+    persist_assessments: bool = True
+    parallel_builds: int = 1
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -30,9 +38,16 @@ class Settings:
             ollama_url=os.environ.get("MAT_OLLAMA_URL", "http://localhost:11434"),
             model=os.environ.get("MAT_MODEL", "codellama"),
             project_dir=os.environ.get("MAT_PROJECT_DIR", os.getcwd()),
-            verbose=os.environ.get("MAT_VERBOSE", "").lower() in ("1", "true", "yes"),
+            verbose=os.environ.get("MAT_VERBOSE", "").lower() in _TRUTHY,
             max_retries=int(os.environ.get("MAT_MAX_RETRIES", "3")),
             timeout=int(os.environ.get("MAT_TIMEOUT", "120")),
+            max_parallel_agents=int(os.environ.get("MAT_MAX_PARALLEL_AGENTS", "4")),
+            keep_alive=os.environ.get("MAT_KEEP_ALIVE", "30m"),
+            ollama_parallel_slots=int(os.environ.get("MAT_OLLAMA_PARALLEL_SLOTS", "4")),
+            persist_assessments=(
+                os.environ.get("MAT_PERSIST_ASSESSMENTS", "true").lower() in _TRUTHY
+            ),
+            parallel_builds=int(os.environ.get("MAT_PARALLEL_BUILDS", "1")),
         )
 
     @classmethod
@@ -44,46 +59,72 @@ class Settings:
             model=codellama
             project_dir=/path/to/project
         """
-        if not config_path.exists():
+        try:
+            text = config_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return None
 
-        config_dict: dict[str, str] = {}
-        with open(config_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    config_dict[key.strip()] = value.strip()
+        config_dict: dict[str, str] = {
+            key.strip(): value.strip()
+            for line in map(str.strip, text.splitlines())
+            if line and not line.startswith("#") and "=" in line
+            for key, value in [line.split("=", 1)]
+        }
 
         return cls(
             ollama_url=config_dict.get("ollama_url", "http://localhost:11434"),
             model=config_dict.get("model", "codellama"),
             project_dir=config_dict.get("project_dir", os.getcwd()),
-            verbose=config_dict.get("verbose", "").lower() in ("1", "true", "yes"),
+            verbose=config_dict.get("verbose", "").lower() in _TRUTHY,
             max_retries=int(config_dict.get("max_retries", "3")),
             timeout=int(config_dict.get("timeout", "120")),
+            max_parallel_agents=int(config_dict.get("max_parallel_agents", "4")),
+            keep_alive=config_dict.get("keep_alive", "30m"),
+            ollama_parallel_slots=int(config_dict.get("ollama_parallel_slots", "4")),
+            persist_assessments=(
+                config_dict.get("persist_assessments", "true").lower() in _TRUTHY
+            ),
+            parallel_builds=int(config_dict.get("parallel_builds", "1")),
         )
 
     @classmethod
     def load(cls, project_dir: Optional[str] = None) -> "Settings":
-        """Load settings with priority: env vars > config file > defaults.
+        """Load settings with priority: project_dir > env vars > config file > defaults.
+
+        Results are memoized on the config file's mtime/size and the MAT_*
+        environment, so repeated loads don't re-read .mat-config.
 
         Args:
-            project_dir: Optional project directory to look for .mat-config
+            project_dir: Optional project directory. Used to find .mat-config
+                and, when given, as the resulting project_dir.
         """
+        search_dir = Path(project_dir) if project_dir else Path.cwd()
+        config_path = search_dir / ".mat-config"
+        try:
+            st = config_path.stat()
+            config_stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            config_stamp = None
+
+        cache_key = (
+            str(search_dir),
+            project_dir,
+            config_stamp,
+            tuple(os.environ.get(name) for name in _ENV_VARS),
+        )
+        cached = _load_cache.get(cache_key)
+        if cached is not None:
+            return replace(cached)
+
         # Start with defaults
         settings = cls()
 
         # Override with config file if it exists
-        search_dir = Path(project_dir) if project_dir else Path.cwd()
-        config_path = search_dir / ".mat-config"
-        file_settings = cls.from_file(config_path)
+        file_settings = cls.from_file(config_path) if config_stamp is not None else None
         if file_settings:
             settings = file_settings
 
-        # Override with environment variables (highest priority)
+        # Override with environment variables
         if os.environ.get("MAT_OLLAMA_URL"):
             settings.ollama_url = os.environ["MAT_OLLAMA_URL"]
         if os.environ.get("MAT_MODEL"):
@@ -91,21 +132,60 @@ class Settings:
         if os.environ.get("MAT_PROJECT_DIR"):
             settings.project_dir = os.environ["MAT_PROJECT_DIR"]
         if os.environ.get("MAT_VERBOSE"):
-            settings.verbose = os.environ["MAT_VERBOSE"].lower() in ("1", "true", "yes")
+            settings.verbose = os.environ["MAT_VERBOSE"].lower() in _TRUTHY
         if os.environ.get("MAT_MAX_RETRIES"):
             settings.max_retries = int(os.environ["MAT_MAX_RETRIES"])
         if os.environ.get("MAT_TIMEOUT"):
             settings.timeout = int(os.environ["MAT_TIMEOUT"])
-
+        if os.environ.get("MAT_MAX_PARALLEL_AGENTS"):
+            settings.max_parallel_agents = int(os.environ["MAT_MAX_PARALLEL_AGENTS"])
+        if os.environ.get("MAT_KEEP_ALIVE"):
+            settings.keep_alive = os.environ["MAT_KEEP_ALIVE"]
+        if os.environ.get("MAT_OLLAMA_PARALLEL_SLOTS"):
+            settings.ollama_parallel_slots = int(os.environ["MAT_OLLAMA_PARALLEL_SLOTS"])
+        if os.environ.get("MAT_PERSIST_ASSESSMENTS"):
+            settings.persist_assessments = (
+                os.environ["MAT_PERSIST_ASSESSMENTS"].lower() in _TRUTHY
+            )
+        if os.environ.get("MAT_PARALLEL_BUILDS"):
+            settings.parallel_builds = int(os.environ["MAT_PARALLEL_BUILDS"])
+
+        # An explicit project directory (e.g. --project-dir) wins over everything
+        if project_dir:
+            settings.project_dir = project_dir
+
+        _load_cache[cache_key] = replace(settings)
         return settings
 
 
+# Environment variables read by Settings.load (part of its cache key)
+_ENV_VARS = (
+    "MAT_OLLAMA_URL",
+    "MAT_MODEL",
+    "MAT_PROJECT_DIR",
+    "MAT_VERBOSE",
+    "MAT_MAX_RETRIES",
+    "MAT_TIMEOUT",
+    "MAT_MAX_PARALLEL_AGENTS",
+    "MAT_KEEP_ALIVE",
+    "MAT_OLLAMA_PARALLEL_SLOTS",
+    "MAT_PERSIST_ASSESSMENTS",
+    "MAT_PARALLEL_BUILDS",
+)
+
+# Settings.load results by (search dir, project_dir, config stat, env values)
+_load_cache: dict[tuple[object, ...], Settings] = {}
+
+
 # Global settings instance (lazy-loaded)
 _settings: Optional[Settings] = None
 
 
 def get_settings() -> Settings:
-    """Get the global settings instance, loading if necessary."""
+    """Get the global settings instance, loading if necessary.
+
+    The instance is memoized; call reload_settings() to re-read it.
+    """
     global _settings
     if _settings is None:
         _settings = Settings.load()
@@ -113,7 +193,11 @@ def get_settings() -> Settings:
 
 
 def reload_settings(project_dir: Optional[str] = None) -> Settings:
-    """Force reload of settings."""
+    """Force reload of settings.
+
+    Args:
+        project_dir: Optional project directory to load settings for.
+    """
     global _settings
     _settings = Settings.load(project_dir)
     return _settings
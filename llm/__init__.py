@@ -3,6 +3,6 @@
 Provides OpenAI-compatible client for Ollama integration.
 """
 
-from llm.client import OllamaClient
+from llm.client import OllamaClient, get_default_client
 
-__all__ = ["OllamaClient"]
+__all__ = ["OllamaClient", "get_default_client"]
@@ -4,14 +4,43 @@ Provides a client that communicates with Ollama using its OpenAI-compatible API,
 with retry logic, streaming support, and proper error handling.
 """
 
+import asyncio
+import atexit
+import functools
+import random
+import threading
 import time
 from collections.abc import Generator
 
-from openai import APIConnectionError, APIStatusError, OpenAI
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    APIConnectionError,
+    APIError,
+    APIStatusError,
+    DefaultHttpxClient,
+    OpenAI,
+    Timeout,
+)
 from openai.types.chat import ChatCompletionMessageParam
 
 from config.settings import Settings, get_settings
 
+# Fallback HTTP timeout (seconds) for requests that don't pass their own
+DEFAULT_HTTP_TIMEOUT = 120.0
+
+# How long (seconds) _list_available_models reuses a fetched model list
+MODELS_CACHE_TTL = 60.0
+
+# Upper bound (seconds) for a single retry backoff sleep
+MAX_BACKOFF = 30.0
+
+# Transient errors worth retrying (connection and status errors are handled
+# separately and never retried)
+_RETRYABLE_ERRORS = (APIError, TimeoutError)
+
+# Conversation history roles passed through to the API
+_HISTORY_ROLES = frozenset({"user", "assistant"})
+
 
 class OllamaClientError(Exception):
     """Base exception for Ollama client errors."""
@@ -37,6 +66,36 @@ class OllamaResponseError(OllamaClientError):
     pass
 
 
+@functools.lru_cache(maxsize=4)
+def _shared_openai_client(ollama_url: str) -> OpenAI:
+    """Get the process-wide OpenAI client for an Ollama server.
+
+    Every agent owns an OllamaClient; sharing the underlying OpenAI client
+    lets them reuse one httpx connection pool instead of one each. The
+    pool is closed at interpreter exit.
+
+    Args:
+        ollama_url: Base URL of the Ollama server.
+
+    Returns:
+        OpenAI client pointed at the server's /v1 endpoint.
+    """
+    # Explicit pool so keep-alive connections are reused across calls; the
+    # OpenAI SDK does its own retries, and per-request timeouts come from
+    # settings in chat()/chat_stream(). Limits and Timeout come from the
+    # SDK so they match the httpx package it is built on.
+    http_client = DefaultHttpxClient(
+        limits=type(DEFAULT_CONNECTION_LIMITS)(max_keepalive_connections=4, max_connections=8),
+        timeout=Timeout(DEFAULT_HTTP_TIMEOUT),
+    )
+    atexit.register(http_client.close)
+    return OpenAI(
+        base_url=f"{ollama_url}/v1",
+        api_key="ollama",  # Ollama doesn't require API key but OpenAI SDK needs one
+        http_client=http_client,
+    )
+
+
 class OllamaClient:
     """OpenAI-compatible client for Ollama.
 
@@ -60,10 +119,25 @@ class OllamaClient:
             settings: Optional settings object. Uses global settings if not provided.
         """
         self._settings = settings or get_settings()
-        self._client = OpenAI(
-            base_url=f"{self._settings.ollama_url}/v1",
-            api_key="ollama",  # Ollama doesn't require API key but OpenAI SDK needs one
-        )
+        self._client = _shared_openai_client(self._settings.ollama_url)
+        self._models_cache: tuple[float, list[str]] | None = None
+        # Pinned system message (set_system) and the last one built per call
+        self._pinned_system: ChatCompletionMessageParam | None = None
+        self._last_system: ChatCompletionMessageParam | None = None
+        # Keep the model (and its KV cache for the repeated system-prompt
+        # prefix) loaded between calls
+        self._extra_body: dict[str, object] = {"keep_alive": self._settings.keep_alive}
+
+    def set_system(self, prompt: str | None) -> None:
+        """Pin a system prompt for this client.
+
+        Calls that pass system_prompt=None then use the pinned prompt
+        instead of sending none. Pass None to unpin.
+
+        Args:
+            prompt: System prompt to pin, or None.
+        """
+        self._pinned_system = {"role": "system", "content": prompt} if prompt else None
 
     @property
     def model(self) -> str:
@@ -96,13 +170,35 @@ class OllamaClient:
         raise OllamaClientError(f"Ollama API error: {error.message}") from error
 
     def _list_available_models(self) -> list[str]:
-        """Try to list available models from Ollama."""
+        """Try to list available models from Ollama.
+
+        Successful results are cached for MODELS_CACHE_TTL seconds so a run
+        of 404s doesn't query the models endpoint every time.
+        """
+        if self._models_cache is not None:
+            fetched_at, models = self._models_cache
+            if time.monotonic() - fetched_at < MODELS_CACHE_TTL:
+                return models
         try:
             # Use the models endpoint
             response = self._client.models.list()
-            return [model.id for model in response.data]
+            models = [model.id for model in response.data]
         except Exception:
             return []
+        self._models_cache = (time.monotonic(), models)
+        return models
+
+    def _backoff(self, attempt: int) -> None:
+        """Sleep before the next retry, unless this was the last attempt.
+
+        Uses capped exponential backoff with up to one second of jitter so
+        concurrent callers don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+        """
+        if attempt < self._settings.max_retries - 1:
+            time.sleep(min(MAX_BACKOFF, 2**attempt + random.random()))
 
     def _validate_response(self, content: str | None) -> str:
         """Validate that response content is not empty or malformed.
@@ -154,8 +250,9 @@ class OllamaClient:
                     model=self._settings.model,
                     messages=messages,
                     timeout=self._settings.timeout,
+                    extra_body=self._extra_body,
                 )
-                content = response.choices[0].message.content
+                content = response.choices[0].message.content if response.choices else None
                 return self._validate_response(content)
 
             except APIConnectionError as e:
@@ -167,14 +264,12 @@ class OllamaClient:
             except OllamaResponseError:
                 # Empty response - retry with backoff
                 last_error = OllamaResponseError("Empty response from model")
-                if attempt < self._settings.max_retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff
+                self._backoff(attempt)
                 continue
 
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 last_error = e
-                if attempt < self._settings.max_retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff
+                self._backoff(attempt)
                 continue
 
         # All retries exhausted
@@ -182,6 +277,32 @@ class OllamaClient:
             f"Failed after {self._settings.max_retries} attempts. Last error: {last_error}"
         )
 
+    async def achat(
+        self,
+        message: str,
+        system_prompt: str | None = None,
+        conversation_history: list[dict[str, str]] | None = None,
+    ) -> str:
+        """Async variant of chat for use inside an event loop.
+
+        Runs chat in a worker thread, so retries, error mapping and the
+        shared connection pool behave exactly as for sync callers.
+
+        Args:
+            message: The user message to send.
+            system_prompt: Optional system prompt for context.
+            conversation_history: Optional list of previous messages.
+
+        Returns:
+            The assistant's response text.
+
+        Raises:
+            OllamaConnectionError: If Ollama is not running.
+            OllamaModelNotFoundError: If the model is not available.
+            OllamaResponseError: If the response is empty.
+        """
+        return await asyncio.to_thread(self.chat, message, system_prompt, conversation_history)
+
     def chat_stream(
         self,
         message: str,
@@ -213,13 +334,19 @@ class OllamaClient:
                     messages=messages,
                     stream=True,
                     timeout=self._settings.timeout,
+                    extra_body=self._extra_body,
                 )
 
+                # Close the HTTP response even if the caller stops iterating
+                # early, so the server stops generating
                 has_content = False
-                for chunk in stream:
-                    if chunk.choices and chunk.choices[0].delta.content:
-                        has_content = True
-                        yield chunk.choices[0].delta.content
+                try:
+                    for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            has_content = True
+                            yield chunk.choices[0].delta.content
+                finally:
+                    stream.close()
 
                 if not has_content:
                     raise OllamaResponseError("Empty streaming response from model")
@@ -234,14 +361,12 @@ class OllamaClient:
 
             except OllamaResponseError:
                 last_error = OllamaResponseError("Empty streaming response")
-                if attempt < self._settings.max_retries - 1:
-                    time.sleep(2**attempt)
+                self._backoff(attempt)
                 continue
 
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 last_error = e
-                if attempt < self._settings.max_retries - 1:
-                    time.sleep(2**attempt)
+                self._backoff(attempt)
                 continue
 
         raise OllamaClientError(
@@ -259,7 +384,8 @@ class OllamaClient:
 
         Args:
             message: The current user message.
-            system_prompt: Optional system prompt.
+            system_prompt: Optional system prompt. If None, the pinned prompt
+                (see set_system) is used when there is one.
             conversation_history: Optional previous messages.
 
         Returns:
@@ -268,17 +394,49 @@ class OllamaClient:
         messages: list[ChatCompletionMessageParam] = []
 
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            # Agents send the same system prompt every turn, so reuse the last
+            # system message (shared, never mutated) when the text matches
+            # (read once, so a client shared across threads can't append
+            # another thread's prompt)
+            system = self._last_system
+            if system is None or system["content"] != system_prompt:
+                system = {"role": "system", "content": system_prompt}
+                self._last_system = system
+            messages.append(system)
+        elif system_prompt is None and self._pinned_system is not None:
+            messages.append(self._pinned_system)
 
         if conversation_history:
-            for hist_msg in conversation_history:
-                role = hist_msg["role"]
-                content = hist_msg["content"]
-                if role == "user":
-                    messages.append({"role": "user", "content": content})
-                elif role == "assistant":
-                    messages.append({"role": "assistant", "content": content})
+            # Only user/assistant turns are forwarded; other roles are dropped
+            messages.extend(
+                {"role": m["role"], "content": m["content"]}  # type: ignore[misc]
+                for m in conversation_history
+                if m["role"] in _HISTORY_ROLES
+            )
 
         messages.append({"role": "user", "content": message})
 
         return messages
+
+
+# Process-wide default client and the settings it was built from
+_default_client: tuple[Settings, OllamaClient] | None = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> OllamaClient:
+    """Get a shared OllamaClient for the current global settings.
+
+    Meant for components that only make stateless calls (an explicit system
+    prompt and no set_system), so they needn't build a client each. A new
+    client is created after reload_settings() replaces the global settings.
+
+    Returns:
+        The shared client.
+    """
+    global _default_client
+    settings = get_settings()
+    with _default_client_lock:
+        if _default_client is None or _default_client[0] is not settings:
+            _default_client = (settings, OllamaClient(settings))
+        return _default_client[1]
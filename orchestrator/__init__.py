@@ -4,11 +4,13 @@ Provides the AgentOrchestrator for coordinating multiple agents
 and ScaleAdapter for complexity-aware planning.
 """
 
+from orchestrator.assessment_cache import AssessmentCache
 from orchestrator.coordinator import (
     AgentOrchestrator,
     AgentType,
     TaskContext,
     TaskResult,
+    WorkflowStep,
 )
 from orchestrator.scale_adapter import (
     ComplexityLevel,
@@ -18,10 +20,12 @@ from orchestrator.scale_adapter import (
 
 __all__ = [
     "AgentOrchestrator",
+    "AssessmentCache",
     "AgentType",
     "ComplexityLevel",
     "ScaleAdapter",
     "ScaleAssessment",
     "TaskContext",
     "TaskResult",
+    "WorkflowStep",
 ]
@@ -0,0 +1,256 @@
+"""Cache of LLM complexity assessments for the ScaleAdapter.
+
+Assessments are keyed by a normalized form of the project description, so
+repeated and trivially rephrased descriptions ("add a login button" vs.
+"Add login button.") reuse the earlier answer instead of calling the LLM.
+When given a path, the cache also persists assessments to a SQLite file so
+later runs can reuse them.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Assessment as produced by the LLM: (level, confidence, reasoning, indicators)
+CachedAssessment = tuple[int, float, str, tuple[str, ...]]
+
+# Default bounds for the in-memory cache
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 3600.0
+
+# Default location and lifetime of persisted assessments
+DEFAULT_PERSIST_PATH = Path("~/.cache/mat/scale_cache.sqlite")
+DEFAULT_PERSIST_TTL = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assessments (
+    hash BLOB PRIMARY KEY,
+    level INTEGER NOT NULL,
+    confidence REAL NOT NULL,
+    reasoning TEXT NOT NULL,
+    indicators TEXT NOT NULL,
+    stored_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS assessments_stored_at ON assessments (stored_at);
+"""
+
+# Version of normalize_description's output, part of each persisted key so
+# entries keyed by an older normalization are never read back
+_KEY_VERSION = "2"
+
+# Filler words that don't change what a description asks for
+_STOPWORDS = frozenset(
+    {"a", "an", "the", "please", "some", "this", "that", "my", "our", "just"}
+)
+
+# Words in any script, keeping inner punctuation ("node.js", "don't") and
+# trailing + or # ("c++", "c#"), or runs of other symbols
+_TOKEN_RE = re.compile(r"\w[\w'.-]*\w[+#]*|\w[+#]*|[^\w\s]+")
+
+# Punctuation that only delimits words and sentences
+_PUNCTUATION = frozenset(".,;:!?'\"()[]")
+
+
+def normalize_description(description: str) -> tuple[str, ...]:
+    """Reduce a description to its significant tokens, in order.
+
+    Args:
+        description: Project description.
+
+    Returns:
+        Lowercased words and symbols with sentence punctuation and filler
+        words removed. Empty if nothing significant is left.
+    """
+    return tuple(
+        token
+        for token in _TOKEN_RE.findall(description.lower())
+        if token not in _STOPWORDS and not _PUNCTUATION.issuperset(token)
+    )
+
+
+@dataclass
+class AssessmentCache:
+    """Bounded, thread-safe LRU cache of assessments with a time-to-live.
+
+    With a path set, assessments are also written to a SQLite database there,
+    and in-memory misses fall back to it. Persistence is best-effort: if the
+    database can't be used, the cache logs a warning and stays in-memory.
+
+    Attributes:
+        max_entries: Maximum number of assessments kept in memory.
+        ttl: Seconds an assessment stays valid in memory.
+        path: Optional SQLite file to persist assessments to.
+        namespace: Distinguishes persisted entries, e.g. by model name, so
+            assessments made by one model aren't reused for another.
+        persist_ttl: Seconds a persisted assessment stays valid.
+    """
+
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    ttl: float = DEFAULT_TTL
+    path: Path | None = None
+    namespace: str = ""
+    persist_ttl: float = DEFAULT_PERSIST_TTL
+    _entries: OrderedDict[tuple[str, ...], tuple[float, CachedAssessment]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _db: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+
+    def get(self, description: str) -> CachedAssessment | None:
+        """Look up the assessment for a description.
+
+        Args:
+            description: Project description.
+
+        Returns:
+            The cached assessment, or None if absent or expired. Always None
+            for descriptions with nothing significant to key on.
+        """
+        key = normalize_description(description)
+        if not key:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, assessment = entry
+                if time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    return assessment
+                del self._entries[key]
+
+            loaded: CachedAssessment | None = self._load(key)
+            if loaded is not None:
+                self._remember(key, loaded)
+            return loaded
+
+    def put(self, description: str, assessment: CachedAssessment) -> None:
+        """Store the assessment for a description, evicting the oldest if full.
+
+        Args:
+            description: Project description.
+            assessment: The assessment to cache. Not stored for descriptions
+                with nothing significant to key on.
+        """
+        key = normalize_description(description)
+        if not key:
+            return
+        with self._lock:
+            self._remember(key, assessment)
+            self._store(key, assessment)
+
+    def clear(self) -> None:
+        """Remove all cached assessments, including persisted ones."""
+        with self._lock:
+            self._entries.clear()
+            db = self._connect()
+            if db is not None:
+                try:
+                    with db:
+                        db.execute("DELETE FROM assessments")
+                except sqlite3.Error as e:
+                    self._disable_persistence(e)
+
+    def close(self) -> None:
+        """Close the database connection, if one is open."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        """Get the number of assessments held in memory."""
+        return len(self._entries)
+
+    def _remember(self, key: tuple[str, ...], assessment: CachedAssessment) -> None:
+        """Add an assessment to the in-memory LRU. Caller holds the lock."""
+        self._entries[key] = (time.monotonic(), assessment)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _hash(self, key: tuple[str, ...]) -> bytes:
+        """Get the database key (a 16-byte digest) for a normalized description."""
+        data = "\0".join((_KEY_VERSION, self.namespace, *key)).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open the database on first use. Caller holds the lock.
+
+        Returns:
+            The connection, or None if persistence is off or unavailable.
+        """
+        if self._db is None and self.path is not None:
+            try:
+                path = self.path.expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(path, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.executescript(_SCHEMA)
+                # Drop expired entries so the table doesn't grow without bound
+                with db:
+                    db.execute(
+                        "DELETE FROM assessments WHERE stored_at < ?",
+                        (time.time() - self.persist_ttl,),
+                    )
+                self._db = db
+            except (OSError, sqlite3.Error) as e:
+                self._disable_persistence(e)
+        return self._db
+
+    def _load(self, key: tuple[str, ...]) -> CachedAssessment | None:
+        """Read a persisted assessment. Caller holds the lock."""
+        db = self._connect()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT level, confidence, reasoning, indicators, stored_at"
+                " FROM assessments WHERE hash = ?",
+                (self._hash(key),),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable_persistence(e)
+            return None
+        if row is None or time.time() - row[4] > self.persist_ttl:
+            return None
+        level, confidence, reasoning, indicators, _ = row
+        return level, confidence, reasoning, tuple(json.loads(indicators))
+
+    def _store(self, key: tuple[str, ...], assessment: CachedAssessment) -> None:
+        """Persist an assessment. Caller holds the lock."""
+        db = self._connect()
+        if db is None:
+            return
+        level, confidence, reasoning, indicators = assessment
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO assessments VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self._hash(key),
+                        level,
+                        confidence,
+                        reasoning,
+                        json.dumps(indicators),
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self._disable_persistence(e)
+
+    def _disable_persistence(self, error: Exception) -> None:
+        """Fall back to in-memory caching after a database error."""
+        logger.warning("Assessment cache persistence disabled: %s", error)
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self.path = None
@@ -5,9 +5,17 @@ It routes tasks to appropriate agents, passes context between them, and
 manages the overall conversation flow.
 """
 
+import asyncio
+import difflib
+import json
+import re
+import threading
+import traceback
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Generic, TypeVar, cast, overload
 
 from agents.base import BaseAgent
 from agents.pm import ProductManagerAgent
@@ -16,9 +24,15 @@ from agents.developer import DeveloperAgent, UserStory
 from agents.ux import UXDesignerAgent
 from agents.scrum_master import ScrumMasterAgent
 from agents.qa import QATesterAgent
+from config.settings import get_settings
 from llm.client import OllamaClient
 from utils.logger import log_agent_action, log_agent_decision
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 
 class AgentType(Enum):
     """Types of agents available in MAT."""
@@ -30,8 +44,76 @@ class AgentType(Enum):
     SCRUM_MASTER = "scrum_master"
     QA_TESTER = "qa_tester"
 
+    # Members are singletons compared by identity, so hash by identity too
+    # instead of Enum's hash(self._name_) on every dict lookup
+    __hash__ = object.__hash__
+
+
+# All agent types in definition order (avoids re-iterating the Enum)
+_AGENT_TYPES: tuple[AgentType, ...] = tuple(AgentType)
+
+# Upper-cased agent names and values, as the LLM may reply with either
+_AGENT_NAME_INDEX: dict[str, AgentType] = {
+    **{agent_type.value.upper(): agent_type for agent_type in _AGENT_TYPES},
+    **{agent_type.name: agent_type for agent_type in _AGENT_TYPES},
+}
+
+# AgentOrchestrator attribute holding each agent type's instance
+_AGENT_ATTRS: dict[AgentType, str] = {
+    AgentType.PRODUCT_MANAGER: "pm_agent",
+    AgentType.ARCHITECT: "architect_agent",
+    AgentType.DEVELOPER: "developer_agent",
+    AgentType.UX_DESIGNER: "ux_agent",
+    AgentType.SCRUM_MASTER: "scrum_master_agent",
+    AgentType.QA_TESTER: "qa_agent",
+}
+
+_AgentT = TypeVar("_AgentT", bound=BaseAgent)
+
+
+class _LazyAgent(Generic[_AgentT]):
+    """AgentOrchestrator agent attribute that creates its agent on first access.
+
+    Assigning an agent (e.g. through the constructor) injects it; assigning
+    None leaves it to be created when first accessed. The agent is kept in
+    the instance __dict__ under the attribute's name, so it can be checked
+    for without being created.
+    """
+
+    def __init__(self, factory: Callable[[], _AgentT]) -> None:
+        self._factory = factory
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, obj: None, owner: type | None = None) -> None: ...
+
+    @overload
+    def __get__(self, obj: "AgentOrchestrator", owner: type | None = None) -> _AgentT: ...
+
+    def __get__(
+        self, obj: "AgentOrchestrator | None", owner: type | None = None
+    ) -> _AgentT | None:
+        if obj is None:
+            # Class access, which dataclass uses as the field's default
+            return None
+        agent: _AgentT | None = obj.__dict__.get(self._name)
+        if agent is None:
+            # Workflow steps access agents from worker threads
+            with obj._agents_lock:
+                agent = obj.__dict__.get(self._name)
+                if agent is None:
+                    agent = self._factory()
+                    obj.__dict__[self._name] = agent
+        return agent
+
+    def __set__(self, obj: "AgentOrchestrator", value: _AgentT | None) -> None:
+        obj.__dict__[self._name] = value
+
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """Context passed between agents during task execution.
 
@@ -39,15 +121,15 @@ class TaskContext:
         task_type: The type of task being executed.
         description: Human-readable description of the task.
         data: Arbitrary data dictionary for passing between agents.
-        previous_agent: The agent that last worked on this context.
         history: List of (agent_type, summary) tuples tracking agent contributions.
+        output_keys: Keys of data entries holding agent responses, oldest first.
     """
 
     task_type: str
     description: str = ""
     data: dict[str, Any] = field(default_factory=dict)
-    previous_agent: AgentType | None = None
     history: list[tuple[AgentType, str]] = field(default_factory=list)
+    output_keys: list[str] = field(default_factory=list)
 
     def add_to_history(self, agent_type: AgentType, summary: str) -> None:
         """Add an agent's contribution to the history.
@@ -57,7 +139,26 @@ class TaskContext:
             summary: Summary of what the agent did.
         """
         self.history.append((agent_type, summary))
-        self.previous_agent = agent_type
+
+    @property
+    def previous_agent(self) -> AgentType | None:
+        """The agent that last worked on this context, if any."""
+        return self.history[-1][0] if self.history else None
+
+    def add_output(self, key: str, response: str) -> None:
+        """Store an agent's response in data.
+
+        Outputs are tracked separately from other data so that only the
+        most recent ones are passed to the next agent in full.
+
+        Args:
+            key: Data key for the response.
+            response: The agent's response.
+        """
+        self.data[key] = response
+        if key in self.output_keys:
+            self.output_keys.remove(key)
+        self.output_keys.append(key)
 
     def get_context_summary(self) -> str:
         """Get a summary of all agent contributions.
@@ -74,7 +175,7 @@ class TaskContext:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result of a task execution.
 
@@ -99,6 +200,19 @@ class TaskResult:
             "errors": self.errors,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the result as UTF-8 JSON.
+
+        Uses orjson when installed; values JSON can't represent are
+        written as their str().
+
+        Returns:
+            JSON encoding of to_dict().
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), default=str)
+        return json.dumps(self.to_dict(), default=str).encode("utf-8")
+
 
 # Task type to agent type mappings for routing
 TASK_ROUTING: dict[str, list[AgentType]] = {
@@ -122,6 +236,104 @@ TASK_ROUTING: dict[str, list[AgentType]] = {
 }
 
 
+def _build_route_index() -> dict[str, list[AgentType]]:
+    """Map every substring of every routing key to its partial-match route.
+
+    For a task type that is a substring of some key, the partial-match scan
+    in determine_agent_for_task always ends at the same key, so the answer
+    can be computed once up front.
+    """
+    index: dict[str, list[AgentType]] = {}
+    for key in TASK_ROUTING:
+        for start in range(len(key) + 1):
+            for end in range(start, len(key) + 1):
+                fragment = key[start:end]
+                if fragment in index:
+                    continue
+                # Same first-match rule as the scan, in TASK_ROUTING order
+                for other, routed_agents in TASK_ROUTING.items():
+                    if other in fragment or fragment in other:
+                        index[fragment] = routed_agents
+                        break
+    return index
+
+
+# Partial-match routes for every substring of a TASK_ROUTING key
+_ROUTE_INDEX = _build_route_index()
+
+# Finds the first TASK_ROUTING key (in table order, not string position)
+# contained in a task type; group N matches the Nth key
+_ROUTE_KEYS: tuple[str, ...] = tuple(TASK_ROUTING)
+_ROUTE_KEY_RE = re.compile(
+    "|".join(f"(?=.*?({re.escape(key)}))" for key in _ROUTE_KEYS), re.DOTALL
+)
+
+# Agent responses passed to the next agent in full; older ones are cut to
+# OUTPUT_PREVIEW_CHARS characters
+FULL_OUTPUTS_IN_CONTEXT = 2
+OUTPUT_PREVIEW_CHARS = 300
+
+# Minimum difflib similarity for a misspelled task type to route like a key
+FUZZY_ROUTE_CUTOFF = 0.8
+
+# Task types whose agents build on each other's output and must run in order
+# (e.g. Developer needs the PM's and Architect's responses in full_build)
+SEQUENTIAL_TASK_TYPES: frozenset[str] = frozenset({"full_build"})
+
+# A workflow step: (agent, message) or (agent, message, predecessor indices)
+WorkflowStep = tuple[AgentType, str] | tuple[AgentType, str, list[int]]
+
+
+def _normalize_workflow(
+    workflow_steps: list[WorkflowStep],
+) -> list[tuple[AgentType, str, frozenset[int]]]:
+    """Turn workflow steps into (agent, message, predecessors) triples.
+
+    Two-element steps depend on the step before them, which reproduces a
+    strictly sequential workflow.
+
+    Args:
+        workflow_steps: Steps as passed to execute_workflow.
+
+    Returns:
+        One (agent_type, message, predecessor set) triple per step.
+
+    Raises:
+        ValueError: If a predecessor index is out of range or self-referential.
+    """
+    total = len(workflow_steps)
+    steps: list[tuple[AgentType, str, frozenset[int]]] = []
+    for i, step in enumerate(workflow_steps):
+        if len(step) == 3:
+            deps = frozenset(step[2])
+        else:
+            deps = frozenset({i - 1}) if i > 0 else frozenset()
+        for dep in deps:
+            if not 0 <= dep < total or dep == i:
+                raise ValueError(f"Workflow step {i + 1} has invalid predecessor index {dep}")
+        steps.append((step[0], step[1], deps))
+    return steps
+
+
+def _describe_error(error: BaseException) -> str:
+    """Format an agent failure for TaskResult.errors.
+
+    Includes the exception type, so e.g. a connection error is
+    distinguishable from a bad response with the same message.
+    """
+    return "".join(traceback.format_exception_only(type(error), error)).strip()
+
+
+def _agent_concurrency() -> int:
+    """Get how many agent LLM calls may be in flight at once.
+
+    Bounded by max_parallel_agents and by the Ollama server's parallel
+    slots; requests beyond the slots would only queue on the server.
+    """
+    settings = get_settings()
+    return max(1, min(settings.max_parallel_agents, settings.ollama_parallel_slots))
+
+
 ORCHESTRATOR_SYSTEM_PROMPT = """You are an Orchestrator agent coordinating a team of specialized agents.
 
 Your responsibilities:
@@ -145,13 +357,17 @@ Guidelines:
 - Escalate issues when agents get stuck"""
 
 
-@dataclass
+# BaseAgent's repr, as the generated one would create every agent
+@dataclass(repr=False)
 class AgentOrchestrator(BaseAgent):
     """Orchestrator that coordinates multiple agents.
 
     Routes tasks to appropriate agents, passes context between them,
     and manages the overall conversation flow.
 
+    Agents are created on first access to their attribute (or get_agent),
+    so agents no task uses are never created.
+
     Attributes:
         pm_agent: Product Manager agent instance.
         architect_agent: Architect agent instance.
@@ -166,16 +382,22 @@ class AgentOrchestrator(BaseAgent):
     role: str = field(default="Coordinate multiple agents on tasks")
     system_prompt: str = field(default=ORCHESTRATOR_SYSTEM_PROMPT)
     client: OllamaClient = field(default_factory=OllamaClient)
-    pm_agent: ProductManagerAgent = field(default_factory=ProductManagerAgent)
-    architect_agent: ArchitectAgent = field(default_factory=ArchitectAgent)
-    developer_agent: DeveloperAgent = field(default_factory=DeveloperAgent)
-    ux_agent: UXDesignerAgent = field(default_factory=UXDesignerAgent)
-    scrum_master_agent: ScrumMasterAgent = field(default_factory=ScrumMasterAgent)
-    qa_agent: QATesterAgent = field(default_factory=QATesterAgent)
+    pm_agent: _LazyAgent[ProductManagerAgent] = _LazyAgent(ProductManagerAgent)
+    architect_agent: _LazyAgent[ArchitectAgent] = _LazyAgent(ArchitectAgent)
+    developer_agent: _LazyAgent[DeveloperAgent] = _LazyAgent(DeveloperAgent)
+    ux_agent: _LazyAgent[UXDesignerAgent] = _LazyAgent(UXDesignerAgent)
+    scrum_master_agent: _LazyAgent[ScrumMasterAgent] = _LazyAgent(ScrumMasterAgent)
+    qa_agent: _LazyAgent[QATesterAgent] = _LazyAgent(QATesterAgent)
     current_context: TaskContext | None = field(default=None)
+    # Guards lazy agent creation (see _LazyAgent) from workflow worker threads
+    _agents_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    # LLM-chosen routes for task types TASK_ROUTING doesn't cover
+    _llm_routes: dict[str, tuple[AgentType, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def get_agent(self, agent_type: AgentType) -> BaseAgent:
-        """Get an agent instance by type.
+        """Get an agent instance by type, creating it on first use.
 
         Args:
             agent_type: The type of agent to retrieve.
@@ -186,17 +408,15 @@ class AgentOrchestrator(BaseAgent):
         Raises:
             ValueError: If the agent type is unknown.
         """
-        agent_map: dict[AgentType, BaseAgent] = {
-            AgentType.PRODUCT_MANAGER: self.pm_agent,
-            AgentType.ARCHITECT: self.architect_agent,
-            AgentType.DEVELOPER: self.developer_agent,
-            AgentType.UX_DESIGNER: self.ux_agent,
-            AgentType.SCRUM_MASTER: self.scrum_master_agent,
-            AgentType.QA_TESTER: self.qa_agent,
-        }
-        agent = agent_map.get(agent_type)
-        if agent is None:
+        attr = _AGENT_ATTRS.get(agent_type)
+        if attr is None:
             raise ValueError(f"Unknown agent type: {agent_type}")
+        agent: BaseAgent = getattr(self, attr)
+        return agent
+
+    def _loaded_agent(self, agent_type: AgentType) -> BaseAgent | None:
+        """Get an agent if it has been created, without creating it."""
+        agent: BaseAgent | None = self.__dict__.get(_AGENT_ATTRS[agent_type])
         return agent
 
     def determine_agent_for_task(self, task_type: str) -> list[AgentType]:
@@ -210,14 +430,27 @@ class AgentOrchestrator(BaseAgent):
         """
         task_type_lower = task_type.lower()
 
-        # Check direct mapping first
-        if task_type_lower in TASK_ROUTING:
-            return TASK_ROUTING[task_type_lower]
+        # Direct hits and task types contained in a key are precomputed
+        routed = _ROUTE_INDEX.get(task_type_lower)
+        if routed is not None:
+            return routed
+
+        # Otherwise only a key contained in the task type can match
+        match = _ROUTE_KEY_RE.match(task_type_lower)
+        if match is not None and match.lastindex is not None:
+            return TASK_ROUTING[_ROUTE_KEYS[match.lastindex - 1]]
+
+        # Near-misses of a key (typos like "implementaton") route like the key
+        close = difflib.get_close_matches(
+            task_type_lower, _ROUTE_KEYS, n=1, cutoff=FUZZY_ROUTE_CUTOFF
+        )
+        if close:
+            return TASK_ROUTING[close[0]]
 
-        # Check for partial matches
-        for key, routed_agents in TASK_ROUTING.items():
-            if key in task_type_lower or task_type_lower in key:
-                return routed_agents
+        # Novel task types are routed by the LLM once per orchestrator
+        cached = self._llm_routes.get(task_type_lower)
+        if cached is not None:
+            return list(cached)
 
         # Use LLM to determine routing if no direct match
         routing_prompt = (
@@ -236,13 +469,11 @@ class AgentOrchestrator(BaseAgent):
         response = self.chat(routing_prompt)
 
         # Parse response into agent types
-        parsed_agents: list[AgentType] = []
-        for part in response.upper().split(","):
-            part = part.strip()
-            for agent_type in AgentType:
-                if agent_type.value.upper() == part or agent_type.name == part:
-                    parsed_agents.append(agent_type)
-                    break
+        parsed_agents = [
+            agent_type
+            for part in response.upper().split(",")
+            if (agent_type := _AGENT_NAME_INDEX.get(part.strip())) is not None
+        ]
 
         if not parsed_agents:
             # Default to developer for unknown tasks
@@ -253,6 +484,7 @@ class AgentOrchestrator(BaseAgent):
             )
             return [AgentType.DEVELOPER]
 
+        self._llm_routes[task_type_lower] = tuple(parsed_agents)
         return parsed_agents
 
     def create_context(self, task_type: str, description: str = "") -> TaskContext:
@@ -282,18 +514,22 @@ class AgentOrchestrator(BaseAgent):
         Returns:
             Formatted context string for the agent.
         """
-        context_str = (
-            f"Task: {context.task_type}\n"
-            f"Description: {context.description}\n\n"
-        )
+        parts = [f"Task: {context.task_type}\nDescription: {context.description}\n\n"]
 
         if context.data:
-            context_str += "Data:\n"
+            # Older agent responses are previewed so the prompt grows
+            # linearly, not quadratically, with the number of steps
+            older = set(context.output_keys[:-FULL_OUTPUTS_IN_CONTEXT])
+            parts.append("Data:\n")
             for key, value in context.data.items():
-                context_str += f"  {key}: {value}\n"
-            context_str += "\n"
+                if key in older and isinstance(value, str) and len(value) > OUTPUT_PREVIEW_CHARS:
+                    parts.append(f"  {key}: {value[:OUTPUT_PREVIEW_CHARS]}... (truncated)\n")
+                else:
+                    parts.append(f"  {key}: {value}\n")
+            parts.append("\n")
 
-        context_str += context.get_context_summary()
+        parts.append(context.get_context_summary())
+        context_str = "".join(parts)
 
         log_agent_action(
             self.name,
@@ -326,7 +562,7 @@ class AgentOrchestrator(BaseAgent):
             full_message = message
 
         log_agent_action(
-            self.name, "Routing to agent", f"{agent_type.value}: {message[:50]}..."
+            self.name, "Routing to agent", "%s: %.50s...", agent_type.value, message
         )
 
         response = agent.chat(full_message)
@@ -337,6 +573,131 @@ class AgentOrchestrator(BaseAgent):
 
         return response
 
+    async def aroute_to_agent(
+        self, agent_type: AgentType, message: str, context: TaskContext | None = None
+    ) -> str:
+        """Route a message to a specific agent without blocking the event loop.
+
+        Args:
+            agent_type: The agent to route to.
+            message: The message to send.
+            context: Optional context to include.
+
+        Returns:
+            The agent's response.
+        """
+        return await asyncio.to_thread(self.route_to_agent, agent_type, message, context)
+
+    def _run_agents_concurrently(
+        self,
+        agents: list[AgentType],
+        message: str,
+        context: TaskContext,
+        max_workers: int,
+    ) -> list[str | Exception]:
+        """Send the same message to several distinct agents in parallel.
+
+        Every agent gets a snapshot of the context taken before any of them
+        runs; _record_outcomes then updates context history in agent order,
+        so the result is deterministic.
+
+        Args:
+            agents: Distinct agent types to run.
+            message: The message to send to each agent.
+            context: The shared task context.
+            max_workers: Maximum number of concurrent LLM calls.
+
+        Returns:
+            Each agent's response, or the exception it raised, in agent order.
+        """
+        full_messages = self._snapshot_messages(agents, message, context)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.get_agent(agent_type).chat, full_message)
+                for agent_type, full_message in zip(agents, full_messages, strict=True)
+            ]
+
+            outcomes: list[str | Exception] = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+
+        return outcomes
+
+    def _snapshot_messages(
+        self, agents: list[AgentType], message: str, context: TaskContext
+    ) -> list[str]:
+        """Build every agent's full message before any of them runs.
+
+        Args:
+            agents: Agent types about to run concurrently.
+            message: The message to send to each agent.
+            context: The shared task context.
+
+        Returns:
+            Context-prefixed messages, in agent order.
+        """
+        full_messages = []
+        for agent_type in agents:
+            log_agent_action(
+                self.name, "Routing to agent", "%s: %.50s...", agent_type.value, message
+            )
+            full_messages.append(
+                f"{self.pass_context_to_agent(agent_type, context)}\n\n{message}"
+            )
+        return full_messages
+
+    def _parallel_workers(self, task_type: str, agents: list[AgentType]) -> int:
+        """Get how many agents of a task may run at once.
+
+        Args:
+            task_type: The type of task being executed.
+            agents: Agent types the task was routed to.
+
+        Returns:
+            Number of concurrent agent calls, or 1 to run them in sequence.
+        """
+        if task_type.lower() in SEQUENTIAL_TASK_TYPES or len(set(agents)) != len(agents):
+            return 1
+        return min(len(agents), _agent_concurrency())
+
+    def _record_outcomes(
+        self,
+        agents: list[AgentType],
+        message: str,
+        outcomes: Sequence[str | BaseException],
+        context: TaskContext,
+    ) -> tuple[list[str], list[str]]:
+        """Fold concurrently gathered agent outcomes into the task context.
+
+        Context history is updated in agent order, so the result doesn't
+        depend on which call finished first.
+
+        Args:
+            agents: Agent types that ran.
+            message: The message each agent was sent.
+            outcomes: Each agent's response or exception, in agent order.
+            context: The shared task context.
+
+        Returns:
+            Tuple of (results, errors) formatted as in execute_task.
+        """
+        results: list[str] = []
+        errors: list[str] = []
+        for agent_type, outcome in zip(agents, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                error_msg = f"{agent_type.value}: {_describe_error(outcome)}"
+                errors.append(error_msg)
+                log_agent_action(self.name, "Agent error", error_msg)
+            else:
+                context.add_to_history(agent_type, f"Processed: {message[:30]}...")
+                results.append(f"{agent_type.value}: {outcome}")
+                context.add_output(f"{agent_type.value}_response", outcome)
+        return results, errors
+
     def execute_task(
         self, task_type: str, message: str, description: str = ""
     ) -> TaskResult:
@@ -364,16 +725,22 @@ class AgentOrchestrator(BaseAgent):
         results: list[str] = []
         errors: list[str] = []
 
-        # Route to each agent in sequence
-        for agent_type in agents:
-            try:
-                response = self.route_to_agent(agent_type, message, context)
-                results.append(f"{agent_type.value}: {response}")
-                context.data[f"{agent_type.value}_response"] = response
-            except Exception as e:
-                error_msg = f"{agent_type.value}: {str(e)}"
-                errors.append(error_msg)
-                log_agent_action(self.name, "Agent error", error_msg)
+        max_workers = self._parallel_workers(task_type, agents)
+        if max_workers > 1:
+            # Independent agents: run their LLM calls concurrently
+            outcomes = self._run_agents_concurrently(agents, message, context, max_workers)
+            results, errors = self._record_outcomes(agents, message, outcomes, context)
+        else:
+            # Route to each agent in sequence
+            for agent_type in agents:
+                try:
+                    response = self.route_to_agent(agent_type, message, context)
+                    results.append(f"{agent_type.value}: {response}")
+                    context.add_output(f"{agent_type.value}_response", response)
+                except Exception as e:
+                    error_msg = f"{agent_type.value}: {_describe_error(e)}"
+                    errors.append(error_msg)
+                    log_agent_action(self.name, "Agent error", error_msg)
 
         success = len(errors) == 0
         message_result = "\n\n".join(results) if results else "No results"
@@ -385,16 +752,86 @@ class AgentOrchestrator(BaseAgent):
             errors=errors,
         )
 
+    async def aexecute_task(
+        self, task_type: str, message: str, description: str = ""
+    ) -> TaskResult:
+        """Execute a task from async code, gathering independent agents.
+
+        Same routing and results as execute_task; independent agents are
+        awaited together with asyncio.gather instead of a thread pool.
+
+        Args:
+            task_type: The type of task to execute.
+            message: The task message/instruction.
+            description: Optional task description.
+
+        Returns:
+            TaskResult with success status and data.
+        """
+        context = self.create_context(task_type, description or message)
+
+        # LLM-based routing may call the model, so keep it off the loop too
+        agents = await asyncio.to_thread(self.determine_agent_for_task, task_type)
+        log_agent_decision(
+            self.name,
+            f"Task '{task_type}' routed to {len(agents)} agent(s)",
+            f"Agents: {[a.value for a in agents]}",
+        )
+
+        if self._parallel_workers(task_type, agents) > 1:
+            full_messages = self._snapshot_messages(agents, message, context)
+            outcomes = await asyncio.gather(
+                *(
+                    self.get_agent(agent_type).achat(full_message)
+                    for agent_type, full_message in zip(agents, full_messages, strict=True)
+                ),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                # Cancellation and interrupts aren't agent errors
+                if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                    raise outcome
+            results, errors = self._record_outcomes(agents, message, outcomes, context)
+        else:
+            results = []
+            errors = []
+            for agent_type in agents:
+                try:
+                    response = await self.aroute_to_agent(agent_type, message, context)
+                    results.append(f"{agent_type.value}: {response}")
+                    context.add_output(f"{agent_type.value}_response", response)
+                except Exception as e:
+                    error_msg = f"{agent_type.value}: {_describe_error(e)}"
+                    errors.append(error_msg)
+                    log_agent_action(self.name, "Agent error", error_msg)
+
+        return TaskResult(
+            success=len(errors) == 0,
+            message="\n\n".join(results) if results else "No results",
+            data=context.data,
+            errors=errors,
+        )
+
     def execute_workflow(
-        self, workflow_steps: list[tuple[AgentType, str]]
+        self, workflow_steps: list[WorkflowStep], fail_fast: bool = False
     ) -> TaskResult:
         """Execute a predefined workflow with multiple steps.
 
+        Steps may name their predecessors as a third element (indices into
+        workflow_steps). Steps whose predecessors have all finished run
+        concurrently, so independent branches overlap. Two-element steps
+        keep the original behaviour: each depends on the step before it.
+
         Args:
-            workflow_steps: List of (agent_type, message) tuples defining the workflow.
+            workflow_steps: List of (agent_type, message) or
+                (agent_type, message, predecessor_indices) tuples.
+            fail_fast: Stop starting new steps after the first failure.
 
         Returns:
             TaskResult with combined results.
+
+        Raises:
+            ValueError: If a step names an invalid predecessor index.
         """
         if not workflow_steps:
             return TaskResult(
@@ -403,39 +840,135 @@ class AgentOrchestrator(BaseAgent):
                 errors=["Empty workflow"],
             )
 
-        # Create context for workflow
-        context = self.create_context("workflow", f"{len(workflow_steps)} steps")
+        steps = _normalize_workflow(workflow_steps)
+        total = len(steps)
 
-        results: dict[str, str] = {}
-        errors: list[str] = []
-
-        for i, (agent_type, message) in enumerate(workflow_steps, 1):
-            step_name = f"step_{i}_{agent_type.value}"
-            log_agent_action(
-                self.name,
-                f"Workflow step {i}/{len(workflow_steps)}",
-                f"Agent: {agent_type.value}",
+        # Create context for workflow
+        context = self.create_context("workflow", f"{total} steps")
+
+        # Guards context reads/writes; per-agent locks keep an agent's
+        # conversation history to one step at a time
+        context_lock = threading.Lock()
+        agent_locks = {agent_type: threading.Lock() for agent_type, _, _ in steps}
+
+        responses: dict[int, str] = {}
+        step_errors: dict[int, str] = {}
+        pending = set(range(total))
+        done: set[int] = set()
+        stopped = False
+
+        max_workers = _agent_concurrency()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight: dict[Future[str], int] = {}
+            while pending or in_flight:
+                if not stopped:
+                    for i in sorted(i for i in pending if steps[i][2] <= done):
+                        pending.remove(i)
+                        agent_type, message, _ = steps[i]
+                        log_agent_action(
+                            self.name,
+                            f"Workflow step {i + 1}/{total}",
+                            f"Agent: {agent_type.value}",
+                        )
+                        future = executor.submit(
+                            self._run_workflow_step,
+                            agent_type,
+                            message,
+                            context,
+                            context_lock,
+                            agent_locks[agent_type],
+                        )
+                        in_flight[future] = i
+
+                if not in_flight:
+                    break  # stopped, or remaining steps wait on a cycle
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = in_flight.pop(future)
+                    agent_type, message, _ = steps[i]
+                    step_name = f"step_{i + 1}_{agent_type.value}"
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        error_msg = f"Step {i + 1} ({agent_type.value}): {_describe_error(e)}"
+                        step_errors[i] = error_msg
+                        log_agent_action(self.name, "Workflow step failed", error_msg)
+                        stopped = stopped or fail_fast
+                    else:
+                        responses[i] = response
+                        with context_lock:
+                            context.add_output(step_name, response)
+                            context.add_to_history(agent_type, f"Processed: {message[:30]}...")
+                    # Failed steps still count as done so later steps run
+                    done.add(i)
+
+        for i in sorted(pending):
+            step_errors[i] = (
+                f"Step {i + 1} ({steps[i][0].value}): "
+                + ("skipped after earlier failure" if stopped else "unresolved dependencies")
             )
 
-            try:
-                response = self.route_to_agent(agent_type, message, context)
-                results[step_name] = response
-                context.data[step_name] = response
-            except Exception as e:
-                error_msg = f"Step {i} ({agent_type.value}): {str(e)}"
-                errors.append(error_msg)
-                log_agent_action(self.name, "Workflow step failed", error_msg)
-                # Continue with remaining steps
-
+        results = {
+            f"step_{i + 1}_{steps[i][0].value}": responses[i] for i in sorted(responses)
+        }
+        errors = [step_errors[i] for i in sorted(step_errors)]
         success = len(errors) == 0
 
         return TaskResult(
             success=success,
-            message=f"Completed {len(results)}/{len(workflow_steps)} steps",
+            message=f"Completed {len(results)}/{total} steps",
             data=results,
             errors=errors,
         )
 
+    async def aexecute_workflow(
+        self, workflow_steps: list[WorkflowStep], fail_fast: bool = False
+    ) -> TaskResult:
+        """Execute a workflow from async code without blocking the event loop.
+
+        Args:
+            workflow_steps: Steps as accepted by execute_workflow.
+            fail_fast: Stop starting new steps after the first failure.
+
+        Returns:
+            TaskResult with combined results.
+
+        Raises:
+            ValueError: If a step names an invalid predecessor index.
+        """
+        return await asyncio.to_thread(self.execute_workflow, workflow_steps, fail_fast)
+
+    def _run_workflow_step(
+        self,
+        agent_type: AgentType,
+        message: str,
+        context: TaskContext,
+        context_lock: threading.Lock,
+        agent_lock: threading.Lock,
+    ) -> str:
+        """Run one workflow step on a worker thread.
+
+        Args:
+            agent_type: The agent to route to.
+            message: The step's message.
+            context: The shared workflow context.
+            context_lock: Lock guarding context.
+            agent_lock: Lock serializing calls to this agent.
+
+        Returns:
+            The agent's response.
+        """
+        with context_lock:
+            context_str = self.pass_context_to_agent(agent_type, context)
+
+        log_agent_action(
+            self.name, "Routing to agent", "%s: %.50s...", agent_type.value, message
+        )
+
+        with agent_lock:
+            return self.get_agent(agent_type).chat(f"{context_str}\n\n{message}")
+
     def implement_story(self, story_data: dict[str, Any]) -> TaskResult:
         """Implement a user story using Developer and QA agents.
 
@@ -447,6 +980,66 @@ class AgentOrchestrator(BaseAgent):
         Returns:
             TaskResult with implementation results.
         """
+        developed = self._develop_story(story_data)
+        if isinstance(developed, TaskResult):
+            return developed
+        return self._verify_story(story_data, *developed)
+
+    def implement_stories(
+        self, stories_data: list[dict[str, Any]], fail_fast: bool = False
+    ) -> list[TaskResult]:
+        """Implement several user stories, overlapping verification and development.
+
+        Stories are pipelined: while QA verifies one story, the Developer
+        starts on the next. Each agent still handles one story at a time, so
+        agent histories stay consistent.
+
+        Args:
+            stories_data: Stories in prd.json format, in implementation order.
+            fail_fast: Stop starting new stories after the first failure.
+
+        Returns:
+            One TaskResult per story, in input order.
+        """
+        results: list[TaskResult | Future[TaskResult]] = []
+        with ThreadPoolExecutor(max_workers=1) as qa_executor:
+            for story_data in stories_data:
+                # Verification still in flight can't stop the next story
+                if fail_fast and any(
+                    not (r if isinstance(r, TaskResult) else r.result()).success
+                    for r in results
+                    if isinstance(r, TaskResult) or r.done()
+                ):
+                    results.append(
+                        TaskResult(
+                            success=False,
+                            message=f"Story {story_data.get('id', '')} skipped",
+                            errors=["Skipped after earlier failure"],
+                        )
+                    )
+                    continue
+
+                developed = self._develop_story(story_data)
+                if isinstance(developed, TaskResult):
+                    results.append(developed)
+                else:
+                    results.append(
+                        qa_executor.submit(self._verify_story, story_data, *developed)
+                    )
+
+        return [r if isinstance(r, TaskResult) else r.result() for r in results]
+
+    def _develop_story(
+        self, story_data: dict[str, Any]
+    ) -> tuple[UserStory, TaskContext, list[str]] | TaskResult:
+        """Run the implementation phase of implement_story.
+
+        Args:
+            story_data: Story data in prd.json format.
+
+        Returns:
+            (story, context, written_files), or a failed TaskResult.
+        """
         story = UserStory.from_dict(story_data)
 
         # Create context
@@ -457,7 +1050,8 @@ class AgentOrchestrator(BaseAgent):
         # Implementation phase
         log_agent_action(self.name, "Implementing story", f"{story.id} - {story.title}")
         try:
-            written_files = self.developer_agent.implement_story(story)
+            developer = cast(DeveloperAgent, self.get_agent(AgentType.DEVELOPER))
+            written_files = developer.implement_story(story)
             context.data["written_files"] = written_files
             context.add_to_history(
                 AgentType.DEVELOPER,
@@ -470,11 +1064,30 @@ class AgentOrchestrator(BaseAgent):
                 data=context.data,
                 errors=[str(e)],
             )
+        return story, context, written_files
+
+    def _verify_story(
+        self,
+        story_data: dict[str, Any],
+        story: UserStory,
+        context: TaskContext,
+        written_files: list[str],
+    ) -> TaskResult:
+        """Run the verification phase of implement_story.
 
-        # Verification phase
+        Args:
+            story_data: Story data in prd.json format.
+            story: The parsed story.
+            context: The story's task context.
+            written_files: Files written by the Developer.
+
+        Returns:
+            TaskResult with verification results.
+        """
         log_agent_action(self.name, "Verifying story", story.id)
         try:
-            verification_report = self.qa_agent.verify_story(story_data, written_files)
+            qa_agent = cast(QATesterAgent, self.get_agent(AgentType.QA_TESTER))
+            verification_report = qa_agent.verify_story(story_data, written_files)
             context.data["verification"] = {
                 "passed": verification_report.overall_passed,
                 "details": verification_report.to_markdown(),
@@ -510,11 +1123,11 @@ class AgentOrchestrator(BaseAgent):
         """
         lines = ["=== Orchestrator Status ==="]
 
-        # List all agents
+        # List all agents (without creating ones no task has used yet)
         lines.append("\nAgents:")
-        for agent_type in AgentType:
-            agent = self.get_agent(agent_type)
-            history_summary = agent.get_history_summary()
+        for agent_type in _AGENT_TYPES:
+            agent = self._loaded_agent(agent_type)
+            history_summary = agent.get_history_summary() if agent else "not yet loaded"
             lines.append(f"  - {agent_type.value}: {history_summary}")
 
         # Current context
@@ -532,9 +1145,10 @@ class AgentOrchestrator(BaseAgent):
         self.current_context = None
         self.clear_history()
 
-        # Reset all agents
-        for agent_type in AgentType:
-            agent = self.get_agent(agent_type)
-            agent.clear_history()
+        # Reset all agents that have been created
+        for agent_type in _AGENT_TYPES:
+            agent = self._loaded_agent(agent_type)
+            if agent is not None:
+                agent.clear_history()
 
         log_agent_action(self.name, "Reset", "All agents and context cleared")
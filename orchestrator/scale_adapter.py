@@ -11,13 +11,25 @@ Complexity Levels:
 - Level 4: Enterprise+ - Full audit trail and multi-team coordination
 """
 
+import contextlib
+import functools
+import re
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any
 
 from agents.base import BaseAgent
-from llm.client import OllamaClient
-from orchestrator.coordinator import AgentType
+from config.settings import get_settings
+from llm.client import OllamaClient, get_default_client
+from orchestrator.assessment_cache import (
+    DEFAULT_PERSIST_PATH,
+    AssessmentCache,
+    normalize_description,
+)
+from orchestrator.coordinator import AgentType, _agent_concurrency
 from utils.logger import log_agent_action, log_agent_decision
 
 
@@ -31,7 +43,30 @@ class ComplexityLevel(IntEnum):
     ENTERPRISE_PLUS = 4  # Full audit trail, multi-team
 
 
-@dataclass
+# Keyword confidence at which an unambiguous keyword match skips the LLM
+KEYWORD_SHORTCUT_CONFIDENCE = 0.75
+
+# Levels indexed by value, for converting bounded ints without an enum lookup
+_LEVEL_BY_VALUE: tuple[ComplexityLevel, ...] = tuple(ComplexityLevel)
+
+# Keyword score weight per level, indexed by value (see _score_keywords)
+_LEVEL_WEIGHT: tuple[float, ...] = tuple(1.0 / (level.value + 1) for level in ComplexityLevel)
+
+
+# Fixed opening of ScaleAssessment.to_markdown, up to the indicator list
+_MARKDOWN_HEADER = (
+    "## Scale Assessment\n"
+    "**Level**: {value} - {name}\n"
+    "**Confidence**: {confidence:.0%}\n"
+    "\n"
+    "### Reasoning\n"
+    "{reasoning}\n"
+    "\n"
+    "### Indicators"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ScaleAssessment:
     """Result of complexity assessment.
 
@@ -39,7 +74,7 @@ class ScaleAssessment:
         level: Detected complexity level.
         confidence: Confidence score (0.0-1.0).
         reasoning: Explanation for the assessment.
-        indicators: List of indicators that influenced the assessment.
+        indicators: Indicators that influenced the assessment.
         recommended_agents: Agent types to involve based on level.
         recommended_workflow: Workflow steps for this complexity.
     """
@@ -47,9 +82,9 @@ class ScaleAssessment:
     level: ComplexityLevel
     confidence: float
     reasoning: str
-    indicators: list[str] = field(default_factory=list)
-    recommended_agents: list[AgentType] = field(default_factory=list)
-    recommended_workflow: list[str] = field(default_factory=list)
+    indicators: tuple[str, ...] = ()
+    recommended_agents: tuple[AgentType, ...] = ()
+    recommended_workflow: tuple[str, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert assessment to dictionary format."""
@@ -58,45 +93,28 @@ class ScaleAssessment:
             "level_name": self.level.name,
             "confidence": self.confidence,
             "reasoning": self.reasoning,
-            "indicators": self.indicators,
+            "indicators": list(self.indicators),
             "recommended_agents": [a.value for a in self.recommended_agents],
-            "recommended_workflow": self.recommended_workflow,
+            "recommended_workflow": list(self.recommended_workflow),
         }
 
     def to_markdown(self) -> str:
         """Convert assessment to markdown format."""
-        lines = [
-            "## Scale Assessment",
-            f"**Level**: {self.level.value} - {self.level.name}",
-            f"**Confidence**: {self.confidence:.0%}",
-            "",
-            "### Reasoning",
-            self.reasoning,
-            "",
-            "### Indicators",
-        ]
-        for indicator in self.indicators:
-            lines.append(f"- {indicator}")
-
-        lines.extend(
-            [
-                "",
-                "### Recommended Agents",
-            ]
+        header = _MARKDOWN_HEADER.format(
+            value=self.level.value,
+            name=self.level.name,
+            confidence=self.confidence,
+            reasoning=self.reasoning,
         )
-        for agent in self.recommended_agents:
-            lines.append(f"- {agent.value}")
-
-        lines.extend(
-            [
-                "",
-                "### Recommended Workflow",
-            ]
+        indicators = "".join(f"\n- {indicator}" for indicator in self.indicators)
+        agents = "".join(f"\n- {agent.value}" for agent in self.recommended_agents)
+        workflow = "".join(
+            f"\n{i}. {step}" for i, step in enumerate(self.recommended_workflow, 1)
+        )
+        return (
+            f"{header}{indicators}\n\n### Recommended Agents{agents}"
+            f"\n\n### Recommended Workflow{workflow}"
         )
-        for i, step in enumerate(self.recommended_workflow, 1):
-            lines.append(f"{i}. {step}")
-
-        return "\n".join(lines)
 
 
 # Level-based workflow definitions
@@ -136,42 +154,26 @@ LEVEL_WORKFLOWS: dict[ComplexityLevel, list[tuple[AgentType, str]]] = {
     ],
 }
 
-# Agent recommendations by level
+# Agent recommendations by level: each workflow's agents, in order of first
+# appearance (derived so the two tables can't drift apart)
 LEVEL_AGENTS: dict[ComplexityLevel, list[AgentType]] = {
-    ComplexityLevel.BUG_FIX: [AgentType.DEVELOPER, AgentType.QA_TESTER],
-    ComplexityLevel.SMALL_FEATURE: [
-        AgentType.PRODUCT_MANAGER,
-        AgentType.DEVELOPER,
-        AgentType.QA_TESTER,
-    ],
-    ComplexityLevel.PRODUCT: [
-        AgentType.PRODUCT_MANAGER,
-        AgentType.ARCHITECT,
-        AgentType.UX_DESIGNER,
-        AgentType.DEVELOPER,
-        AgentType.QA_TESTER,
-    ],
-    ComplexityLevel.ENTERPRISE: [
-        AgentType.PRODUCT_MANAGER,
-        AgentType.ARCHITECT,
-        AgentType.UX_DESIGNER,
-        AgentType.SCRUM_MASTER,
-        AgentType.DEVELOPER,
-        AgentType.QA_TESTER,
-    ],
-    ComplexityLevel.ENTERPRISE_PLUS: [
-        AgentType.PRODUCT_MANAGER,
-        AgentType.ARCHITECT,
-        AgentType.UX_DESIGNER,
-        AgentType.SCRUM_MASTER,
-        AgentType.DEVELOPER,
-        AgentType.QA_TESTER,
-    ],
+    level: list(dict.fromkeys(agent for agent, _ in steps))
+    for level, steps in LEVEL_WORKFLOWS.items()
+}
+
+# Task descriptions for agents added to a workflow by adjust_workflow
+GENERIC_AGENT_TASKS: dict[AgentType, str] = {
+    AgentType.PRODUCT_MANAGER: "Requirements analysis",
+    AgentType.ARCHITECT: "Technical design",
+    AgentType.UX_DESIGNER: "UX review",
+    AgentType.DEVELOPER: "Implementation",
+    AgentType.QA_TESTER: "Testing",
+    AgentType.SCRUM_MASTER: "Coordination",
 }
 
 # Keywords that indicate complexity levels
-LEVEL_KEYWORDS: dict[ComplexityLevel, list[str]] = {
-    ComplexityLevel.BUG_FIX: [
+LEVEL_KEYWORDS: dict[ComplexityLevel, tuple[str, ...]] = {
+    ComplexityLevel.BUG_FIX: (
         "bug",
         "fix",
         "error",
@@ -182,8 +184,8 @@ LEVEL_KEYWORDS: dict[ComplexityLevel, list[str]] = {
         "not working",
         "issue",
         "patch",
-    ],
-    ComplexityLevel.SMALL_FEATURE: [
+    ),
+    ComplexityLevel.SMALL_FEATURE: (
         "add",
         "simple",
         "small",
@@ -194,8 +196,8 @@ LEVEL_KEYWORDS: dict[ComplexityLevel, list[str]] = {
         "tweak",
         "update",
         "change",
-    ],
-    ComplexityLevel.PRODUCT: [
+    ),
+    ComplexityLevel.PRODUCT: (
         "feature",
         "new functionality",
         "user story",
@@ -204,8 +206,8 @@ LEVEL_KEYWORDS: dict[ComplexityLevel, list[str]] = {
         "implement",
         "build",
         "create",
-    ],
-    ComplexityLevel.ENTERPRISE: [
+    ),
+    ComplexityLevel.ENTERPRISE: (
         "compliance",
         "security",
         "audit",
@@ -214,8 +216,8 @@ LEVEL_KEYWORDS: dict[ComplexityLevel, list[str]] = {
         "scale",
         "performance",
         "sla",
-    ],
-    ComplexityLevel.ENTERPRISE_PLUS: [
+    ),
+    ComplexityLevel.ENTERPRISE_PLUS: (
         "multi-team",
         "cross-functional",
         "organization-wide",
@@ -223,7 +225,79 @@ LEVEL_KEYWORDS: dict[ComplexityLevel, list[str]] = {
         "infrastructure",
         "migration",
         "transformation",
-    ],
+    ),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class LevelEntry:
+    """Everything looked up for one complexity level, gathered in one place.
+
+    Attributes:
+        keywords: Keywords that indicate the level.
+        agents: Recommended agents.
+        workflow: Recommended (agent_type, task_description) steps.
+        workflow_strings: The workflow steps as "agent: task" descriptions.
+    """
+
+    keywords: frozenset[str]
+    agents: tuple[AgentType, ...]
+    workflow: tuple[tuple[AgentType, str], ...]
+    workflow_strings: tuple[str, ...]
+
+
+def _build_level_table() -> tuple[LevelEntry, ...]:
+    """Build one LevelEntry per complexity level, indexed by level value."""
+    return tuple(
+        LevelEntry(
+            keywords=frozenset(LEVEL_KEYWORDS[level]),
+            agents=tuple(LEVEL_AGENTS[level]),
+            workflow=tuple(LEVEL_WORKFLOWS[level]),
+            workflow_strings=tuple(
+                f"{agent.value}: {task}" for agent, task in LEVEL_WORKFLOWS[level]
+            ),
+        )
+        for level in ComplexityLevel
+    )
+
+
+# Per-level lookups for the assessment hot path; index with the level itself
+LEVEL_TABLE = _build_level_table()
+
+
+def _index_keywords() -> dict[str, ComplexityLevel]:
+    """Map each keyword to its level, in LEVEL_KEYWORDS order."""
+    levels: dict[str, ComplexityLevel] = {}
+    for level, keywords in LEVEL_KEYWORDS.items():
+        for kw in keywords:
+            levels.setdefault(kw, level)
+    return levels
+
+
+# Level of every keyword, and its position in LEVEL_KEYWORDS order; both are
+# fixed at import so _detect_keywords does only dict lookups per match
+_KEYWORD_LEVEL = _index_keywords()
+_KEYWORD_ORDER = {kw: i for i, kw in enumerate(_KEYWORD_LEVEL)}
+
+# "LEVEL: keyword" indicator reported for each keyword, formatted once
+_KEYWORD_INDICATOR = {
+    kw: sys.intern(f"{level.name}: {kw}") for kw, level in _KEYWORD_LEVEL.items()
+}
+
+# Finds keyword occurrences in one scan; the lookahead lets matches
+# overlap, and the longest keyword wins at each position
+_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_LEVEL, key=len, reverse=True))
+    + "))"
+)
+
+# Shorter keywords hidden by a longer match at the same position (only
+# keywords that have such prefixes are listed)
+_KEYWORD_PREFIXES: dict[str, tuple[str, ...]] = {
+    kw: prefixes
+    for kw in _KEYWORD_LEVEL
+    if (prefixes := tuple(o for o in _KEYWORD_LEVEL if o != kw and kw.startswith(o)))
 }
 
 
@@ -251,6 +325,74 @@ REASONING: [brief explanation]
 INDICATORS: [comma-separated list of complexity indicators found]"""
 
 
+# Static part of the assessment prompt; the description is appended last so
+# everything before it is a shared prefix across assessments
+_ASSESSMENT_PROMPT_HEAD = (
+    "Analyze the project description below and determine its complexity level.\n"
+    "\n"
+    "Respond with EXACTLY this format:\n"
+    "LEVEL: [0-4]\n"
+    "CONFIDENCE: [0.0-1.0]\n"
+    "REASONING: [one sentence explanation]\n"
+    "INDICATORS: [comma-separated list]\n"
+    "\n"
+    "PROJECT DESCRIPTION:\n"
+)
+
+# Fields of an assessment response, and one "FIELD: value" line of it
+_RESPONSE_FIELDS = ("LEVEL", "CONFIDENCE", "REASONING", "INDICATORS")
+_RESPONSE_FIELD_RE = re.compile(
+    rf"^[^\S\n]*({'|'.join(_RESPONSE_FIELDS)}):[^\S\n]*(.*?)\s*$", re.MULTILINE
+)
+
+
+def _parse_assessment(response: str) -> tuple[ComplexityLevel, float, str, list[str]]:
+    """Parse an LLM assessment response.
+
+    Fields that are missing or unparseable keep their defaults; if a field
+    appears more than once, the last valid value wins.
+
+    Args:
+        response: Response in the LEVEL/CONFIDENCE/REASONING/INDICATORS format.
+
+    Returns:
+        Tuple of (level, confidence, reasoning, indicators).
+    """
+    level = ComplexityLevel.PRODUCT  # default
+    confidence = 0.5
+    reasoning = "LLM analysis"
+    indicators: list[str] = []
+
+    for name, value in _RESPONSE_FIELD_RE.findall(response):
+        if name == "LEVEL":
+            with contextlib.suppress(ValueError):
+                level = _LEVEL_BY_VALUE[min(4, max(0, int(value)))]
+        elif name == "CONFIDENCE":
+            with contextlib.suppress(ValueError):
+                confidence = min(1.0, max(0.0, float(value)))
+        elif name == "REASONING":
+            reasoning = value
+        else:
+            indicators = [i.strip() for i in value.split(",") if i.strip()]
+
+    return level, confidence, reasoning, indicators
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_assessment_cache(persist: bool, namespace: str) -> AssessmentCache:
+    """Get the assessment cache shared by ScaleAdapters with these settings.
+
+    Sharing it means one SQLite connection per process, not one per adapter.
+    """
+    return AssessmentCache(path=DEFAULT_PERSIST_PATH if persist else None, namespace=namespace)
+
+
+def _default_assessment_cache() -> AssessmentCache:
+    """Get the assessment cache configured by the current settings."""
+    settings = get_settings()
+    return _shared_assessment_cache(settings.persist_assessments, settings.model)
+
+
 @dataclass
 class ScaleAdapter(BaseAgent):
     """Analyzes project complexity and recommends appropriate planning depth.
@@ -264,13 +406,15 @@ class ScaleAdapter(BaseAgent):
         system_prompt: System prompt for LLM.
         client: LLM client instance.
         last_assessment: Most recent scale assessment.
+        cache: LLM assessments by normalized description.
     """
 
     name: str = field(default="ScaleAdapter")
     role: str = field(default="Analyze project complexity and adapt planning depth")
     system_prompt: str = field(default=SCALE_ADAPTER_SYSTEM_PROMPT)
-    client: OllamaClient = field(default_factory=OllamaClient)
+    client: OllamaClient = field(default_factory=get_default_client)
     last_assessment: ScaleAssessment | None = field(default=None)
+    cache: AssessmentCache = field(default_factory=_default_assessment_cache, repr=False)
 
     def _detect_keywords(self, text: str) -> dict[ComplexityLevel, list[str]]:
         """Detect complexity-indicating keywords in text.
@@ -281,13 +425,16 @@ class ScaleAdapter(BaseAgent):
         Returns:
             Dictionary mapping levels to found keywords.
         """
-        text_lower = text.lower()
         found: dict[ComplexityLevel, list[str]] = {}
 
-        for level, keywords in LEVEL_KEYWORDS.items():
-            matches = [kw for kw in keywords if kw in text_lower]
-            if matches:
-                found[level] = matches
+        # Report matches per level in LEVEL_KEYWORDS order, as a per-keyword
+        # scan would
+        matched = set(_KEYWORD_RE.findall(text.lower()))
+        if _KEYWORD_PREFIXES:
+            for kw in matched.intersection(_KEYWORD_PREFIXES):
+                matched.update(_KEYWORD_PREFIXES[kw])
+        for kw in sorted(matched, key=_KEYWORD_ORDER.__getitem__):
+            found.setdefault(_KEYWORD_LEVEL[kw], []).append(kw)
 
         return found
 
@@ -300,27 +447,38 @@ class ScaleAdapter(BaseAgent):
         Returns:
             Tuple of (level, confidence, indicators).
         """
-        found_keywords = self._detect_keywords(description)
+        return self._score_keywords(self._detect_keywords(description))
+
+    def _score_keywords(
+        self, found_keywords: dict[ComplexityLevel, list[str]]
+    ) -> tuple[ComplexityLevel, float, list[str]]:
+        """Score detected keywords into a complexity assessment.
+
+        Args:
+            found_keywords: Keywords by level, as from _detect_keywords.
 
+        Returns:
+            Tuple of (level, confidence, indicators).
+        """
         if not found_keywords:
             # Default to PRODUCT level if no keywords found
             return ComplexityLevel.PRODUCT, 0.5, ["No specific complexity indicators found"]
 
-        # Weight by level (higher levels need stronger evidence)
-        level_scores: dict[ComplexityLevel, float] = {}
+        # Weight by level (higher levels need stronger evidence); scores are
+        # indexed by level value
+        scores = [0.0] * len(ComplexityLevel)
+        total_matches = 0
         all_indicators: list[str] = []
 
         for level, keywords in found_keywords.items():
-            # Higher levels get less weight per keyword
-            weight = 1.0 / (level.value + 1)
-            level_scores[level] = len(keywords) * weight
-            all_indicators.extend([f"{level.name}: {kw}" for kw in keywords])
+            scores[level.value] = len(keywords) * _LEVEL_WEIGHT[level.value]
+            total_matches += len(keywords)
+            all_indicators.extend(map(_KEYWORD_INDICATOR.__getitem__, keywords))
 
-        # Select level with highest score
-        best_level = max(level_scores, key=lambda k: level_scores[k])
+        # Select level with highest score (the lowest level wins ties)
+        best_level = _LEVEL_BY_VALUE[max(range(len(scores)), key=scores.__getitem__)]
 
         # Calculate confidence based on number of matching keywords
-        total_matches = sum(len(kws) for kws in found_keywords.values())
         confidence = min(0.9, 0.3 + (total_matches * 0.15))
 
         return best_level, confidence, all_indicators
@@ -334,46 +492,32 @@ class ScaleAdapter(BaseAgent):
         Returns:
             Tuple of (level, confidence, reasoning, indicators).
         """
-        prompt = f"""Analyze this project description and determine its complexity level:
-
-PROJECT DESCRIPTION:
-{description}
-
-Respond with EXACTLY this format:
-LEVEL: [0-4]
-CONFIDENCE: [0.0-1.0]
-REASONING: [one sentence explanation]
-INDICATORS: [comma-separated list]"""
-
-        response = self.chat(prompt)
-
-        # Parse response
-        level = ComplexityLevel.PRODUCT  # default
-        confidence = 0.5
-        reasoning = "LLM analysis"
-        indicators: list[str] = []
-
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line.startswith("LEVEL:"):
-                try:
-                    level_val = int(line.split(":", 1)[1].strip())
-                    level = ComplexityLevel(min(4, max(0, level_val)))
-                except (ValueError, IndexError):
-                    pass
-            elif line.startswith("CONFIDENCE:"):
-                try:
-                    confidence = float(line.split(":", 1)[1].strip())
-                    confidence = min(1.0, max(0.0, confidence))
-                except (ValueError, IndexError):
-                    pass
-            elif line.startswith("REASONING:"):
-                reasoning = line.split(":", 1)[1].strip()
-            elif line.startswith("INDICATORS:"):
-                indicators_str = line.split(":", 1)[1].strip()
-                indicators = [i.strip() for i in indicators_str.split(",") if i.strip()]
-
-        return level, confidence, reasoning, indicators
+        prompt = f"{_ASSESSMENT_PROMPT_HEAD}{description}"
+
+        # Stateless call: every assessment sends the same system prompt and
+        # prompt head, so the server can reuse their cached prefix, and
+        # earlier assessments don't leak into this one via agent history
+        stream = self.client.chat_stream(prompt, system_prompt=self.system_prompt)
+
+        # Stop reading once every field has arrived on a complete line,
+        # rather than waiting for any trailing explanation
+        chunks: list[str] = []
+        seen: set[str] = set()
+        pending = ""
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                pending += chunk
+                if "\n" not in pending:
+                    continue
+                complete, _, pending = pending.rpartition("\n")
+                seen.update(name for name, _ in _RESPONSE_FIELD_RE.findall(complete))
+                if len(seen) == len(_RESPONSE_FIELDS):
+                    break
+        finally:
+            stream.close()
+
+        return _parse_assessment("".join(chunks))
 
     def assess_complexity(
         self, description: str, use_llm: bool = True
@@ -389,16 +533,38 @@ INDICATORS: [comma-separated list]"""
         """
         log_agent_action(self.name, "Assessing complexity", f"Description: {description[:50]}...")
 
-        if use_llm:
-            level, confidence, reasoning, indicators = self._llm_based_assessment(description)
+        # The keyword pass is cheap, and when its keywords all point at one
+        # level with high confidence the LLM would add only latency
+        found_keywords = self._detect_keywords(description)
+        level, confidence, keyword_indicators = self._score_keywords(found_keywords)
+        unambiguous = (
+            len(found_keywords) == 1 and confidence >= KEYWORD_SHORTCUT_CONFIDENCE
+        )
+
+        if use_llm and unambiguous:
+            log_agent_action(self.name, "Skipping LLM assessment", "Unambiguous keyword match")
+            indicators = tuple(keyword_indicators)
+            reasoning = f"High-confidence keyword match for {level.name} level"
+        elif use_llm:
+            cached = self.cache.get(description)
+            if cached is not None:
+                log_agent_action(self.name, "Assessment cache hit")
+                level_value, confidence, reasoning, indicators = cached
+                level = _LEVEL_BY_VALUE[level_value]
+            else:
+                level, confidence, reasoning, llm_indicators = self._llm_based_assessment(
+                    description
+                )
+                indicators = tuple(llm_indicators)
+                self.cache.put(description, (level.value, confidence, reasoning, indicators))
         else:
-            level, confidence, indicators = self._keyword_based_assessment(description)
+            indicators = tuple(keyword_indicators)
             reasoning = f"Keyword-based assessment detected {level.name} level"
 
         # Get recommended agents and workflow for this level
-        recommended_agents = LEVEL_AGENTS.get(level, LEVEL_AGENTS[ComplexityLevel.PRODUCT])
-        workflow_steps = LEVEL_WORKFLOWS.get(level, LEVEL_WORKFLOWS[ComplexityLevel.PRODUCT])
-        recommended_workflow = [f"{agent.value}: {task}" for agent, task in workflow_steps]
+        entry = LEVEL_TABLE[level]
+        recommended_agents = entry.agents
+        recommended_workflow = entry.workflow_strings
 
         assessment = ScaleAssessment(
             level=level,
@@ -419,6 +585,47 @@ INDICATORS: [comma-separated list]"""
 
         return assessment
 
+    def assess_complexity_batch(
+        self, descriptions: Sequence[str], use_llm: bool = True
+    ) -> list[ScaleAssessment]:
+        """Assess the complexity of several descriptions at once.
+
+        LLM assessments run concurrently, up to the configured agent
+        concurrency, so the server can batch them and reuse the shared
+        system prompt prefix. Descriptions that normalize to the same text
+        are assessed once.
+
+        Args:
+            descriptions: Project descriptions to analyze.
+            use_llm: Whether to use LLM for assessment (default True).
+
+        Returns:
+            One ScaleAssessment per description, in input order.
+        """
+        unique: dict[tuple[str, ...], str] = {}
+        keys: list[tuple[str, ...]] = []
+        for description in descriptions:
+            # Descriptions with nothing significant to compare aren't merged
+            # (keyed by their raw text, which no normalized key can equal)
+            key = normalize_description(description) or (description,)
+            unique.setdefault(key, description)
+            keys.append(key)
+
+        def assess(description: str) -> ScaleAssessment:
+            return self.assess_complexity(description, use_llm=use_llm)
+
+        max_workers = _agent_concurrency() if use_llm else 1
+        if max_workers > 1 and len(unique) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+                results = dict(zip(unique, executor.map(assess, unique.values()), strict=True))
+        else:
+            results = {key: assess(description) for key, description in unique.items()}
+
+        assessments = [results[key] for key in keys]
+        if assessments:
+            self.last_assessment = assessments[-1]
+        return assessments
+
     def auto_detect_level(self, project_description: str) -> ComplexityLevel:
         """Auto-detect complexity level from project description.
 
@@ -473,26 +680,21 @@ INDICATORS: [comma-separated list]"""
         Returns:
             Adjusted workflow steps.
         """
-        workflow = list(LEVEL_WORKFLOWS.get(base_level, LEVEL_WORKFLOWS[ComplexityLevel.PRODUCT]))
+        workflow = list(LEVEL_TABLE[base_level].workflow)
 
         # Remove specified agents
         if remove_agents:
-            workflow = [(agent, task) for agent, task in workflow if agent not in remove_agents]
+            removed = frozenset(remove_agents)
+            workflow = [(agent, task) for agent, task in workflow if agent not in removed]
 
         # Add specified agents (at the end)
         if add_agents:
+            present = {agent for agent, _ in workflow}
             for agent in add_agents:
-                if not any(a == agent for a, _ in workflow):
+                if agent not in present:
                     # Add with generic task description
-                    task_map = {
-                        AgentType.PRODUCT_MANAGER: "Requirements analysis",
-                        AgentType.ARCHITECT: "Technical design",
-                        AgentType.UX_DESIGNER: "UX review",
-                        AgentType.DEVELOPER: "Implementation",
-                        AgentType.QA_TESTER: "Testing",
-                        AgentType.SCRUM_MASTER: "Coordination",
-                    }
-                    workflow.append((agent, task_map.get(agent, "Task execution")))
+                    workflow.append((agent, GENERIC_AGENT_TASKS.get(agent, "Task execution")))
+                    present.add(agent)
 
         return workflow
 
@@ -504,13 +706,10 @@ INDICATORS: [comma-separated list]"""
         """
         lines = ["=== MAT Scale Levels ===", ""]
 
-        for level in ComplexityLevel:
-            agents = LEVEL_AGENTS.get(level, [])
-            workflow = LEVEL_WORKFLOWS.get(level, [])
-
+        for level, entry in zip(ComplexityLevel, LEVEL_TABLE, strict=True):
             lines.append(f"Level {level.value}: {level.name}")
-            lines.append(f"  Agents: {', '.join(a.value for a in agents)}")
-            lines.append(f"  Steps: {len(workflow)}")
+            lines.append(f"  Agents: {', '.join(a.value for a in entry.agents)}")
+            lines.append(f"  Steps: {len(entry.workflow)}")
             lines.append("")
 
         return "\n".join(lines)
@@ -6,6 +6,9 @@ implementing and verifying each one until all stories pass or fail.
 
 import json
 import logging
+import os
+import queue
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -16,15 +19,87 @@ from agents.scrum_master import ScrumMasterAgent, StoryStatus
 from config import get_settings
 from utils.git_ops import auto_commit_story
 from utils.logger import (
+    StoryProgress,
     create_progress_tracker,
     log_agent_action,
     log_build_complete,
     log_build_start,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _build_concurrency() -> int:
+    """Get how many stories the build loop may implement at once.
+
+    Bounded by parallel_builds and by the Ollama server's parallel slots;
+    stories beyond the slots would only queue on the server.
+    """
+    settings = get_settings()
+    return max(1, min(settings.parallel_builds, settings.ollama_parallel_slots))
+
+
+def journal_path(prd_path: Path) -> Path:
+    """Get the path of the pass journal kept next to prd.json.
+
+    Each line of the journal is a JSON object such as
+    {"id": "US-001", "passes": true}, appended when a story passes. The
+    journal is folded into prd.json (and removed) whenever prd.json is saved.
+
+    Args:
+        prd_path: Path to prd.json.
+
+    Returns:
+        Path to the journal, e.g. prd.journal.jsonl.
+    """
+    return prd_path.with_suffix(".journal.jsonl")
+
+
+def discard_journal(prd_path: Path) -> None:
+    """Remove the pass journal kept next to prd.json, if any.
+
+    Call this whenever prd.json is replaced wholesale (e.g. by a fresh
+    conversion), or the next load_prd replays the old passes onto it.
+
+    Args:
+        prd_path: Path to prd.json.
+    """
+    journal_path(prd_path).unlink(missing_ok=True)
+
+
+def read_journal(path: Path) -> set[str]:
+    """Read the IDs of stories recorded as passed in a pass journal.
+
+    Lines that can't be parsed (e.g. one cut short by a crash) are skipped.
+
+    Args:
+        path: Path to the journal.
+
+    Returns:
+        Story IDs marked as passed; empty if there is no journal.
+    """
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return set()
+
+    passed: set[str] = set()
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get("passes") is True:
+            passed.add(str(entry.get("id")))
+    return passed
+
+
 class BuildLoopError(Exception):
     """Base exception for build loop errors."""
 
@@ -86,13 +161,33 @@ class BuildLoop:
     qa_agent: QATesterAgent = field(default_factory=QATesterAgent)
     scrum_master: ScrumMasterAgent = field(default_factory=ScrumMasterAgent)
     _prd_data: dict[str, Any] | None = field(default=None, repr=False)
+    # Whether passes recorded in the journal are not yet saved to prd.json
+    _dirty: bool = field(default=False, repr=False)
+    # (prd_path, full path) from the last _get_prd_path call
+    _resolved_prd_path: tuple[Path, Path] | None = field(default=None, repr=False)
+    # Stories by ID, stories in priority order (sorted on first use) with a
+    # cursor past the leading passed ones, and the number not yet passed;
+    # reset by load_prd
+    _story_index: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+    _stories_by_priority: list[dict[str, Any]] | None = field(default=None, repr=False)
+    _next_story_pos: int = field(default=0, repr=False)
+    _remaining: int = field(default=0, repr=False)
 
     def _get_prd_path(self) -> Path:
-        """Get the full path to prd.json."""
+        """Get the full path to prd.json.
+
+        A relative prd_path is resolved against the project directory once,
+        and again only if prd_path is reassigned.
+        """
+        cached = self._resolved_prd_path
+        if cached is not None and cached[0] is self.prd_path:
+            return cached[1]
         if self.prd_path.is_absolute():
-            return self.prd_path
-        settings = get_settings()
-        return Path(settings.project_dir) / self.prd_path
+            full_path = self.prd_path
+        else:
+            full_path = Path(get_settings().project_dir) / self.prd_path
+        self._resolved_prd_path = (self.prd_path, full_path)
+        return full_path
 
     def load_prd(self) -> dict[str, Any]:
         """Load and validate prd.json.
@@ -109,9 +204,11 @@ class BuildLoop:
             raise PRDLoadError(f"prd.json not found at {prd_path}")
 
         try:
-            with open(prd_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            with open(prd_path, "rb") as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError as e:
+            # Covers json/orjson.JSONDecodeError and bad UTF-8
             raise PRDLoadError(f"Invalid JSON in prd.json: {e}") from e
 
         # Validate required fields
@@ -123,35 +220,79 @@ class BuildLoop:
 
         self._prd_data = data
         log_agent_action("BuildLoop", "Loaded PRD", f"{len(data['userStories'])} stories")
+
+        # Apply passes journaled by an earlier run that didn't get to save;
+        # saving also drops the journal, including any line cut short
+        journal = journal_path(prd_path)
+        if journal.exists():
+            journaled = read_journal(journal)
+            for story in data["userStories"]:
+                if story.get("id") in journaled:
+                    story["passes"] = True
+            self.save_prd()
+
+        self._index_stories(data["userStories"])
         result: dict[str, Any] = data
         return result
 
     def save_prd(self) -> None:
-        """Save current PRD data back to prd.json."""
+        """Save current PRD data back to prd.json.
+
+        This folds in every journaled pass, so the journal is removed.
+        """
         if self._prd_data is None:
             return
 
         prd_path = self._get_prd_path()
-        with open(prd_path, "w", encoding="utf-8") as f:
-            json.dump(self._prd_data, f, indent=2)
-            f.write("\n")  # Add trailing newline
+        # Indented, with a trailing newline
+        if orjson is not None:
+            encoded = orjson.dumps(
+                self._prd_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        else:
+            encoded = (json.dumps(self._prd_data, indent=2) + "\n").encode("utf-8")
+        # Write a temp file and swap it in, so a crash never leaves a torn prd.json
+        tmp_path = prd_path.with_name(prd_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(encoded)
+                f.flush()
+                # Durable before the journal it replaces is removed
+                os.fsync(f.fileno())
+            os.replace(tmp_path, prd_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        discard_journal(prd_path)
+        self._dirty = False
         log_agent_action("BuildLoop", "Saved PRD", str(prd_path))
 
     def mark_story_passed(self, story_id: str) -> None:
         """Mark a story as passed in prd.json.
 
+        Rather than rewriting prd.json per story, the pass is appended to
+        the journal next to it; load_prd and save_prd fold it in.
+
         Args:
             story_id: ID of the story to mark as passed.
         """
         if self._prd_data is None:
             return
 
-        for story in self._prd_data.get("userStories", []):
-            if story.get("id") == story_id:
-                story["passes"] = True
-                break
+        story = self._story_index.get(story_id)
+        if story is not None and not story.get("passes", False):
+            story["passes"] = True
+            self._remaining -= 1
 
-        self.save_prd()
+        entry = json.dumps({"id": story_id, "passes": True}) + "\n"
+        try:
+            with open(journal_path(self._get_prd_path()), "ab") as f:
+                f.write(entry.encode("utf-8"))
+        except OSError as e:
+            logger.warning("[BuildLoop] Could not journal %s, saving PRD: %s", story_id, e)
+            self.save_prd()
+            return
+        self._dirty = True
 
     def get_next_story(self) -> dict[str, Any] | None:
         """Get the next story with passes=false.
@@ -162,14 +303,19 @@ class BuildLoop:
         if self._prd_data is None:
             return None
 
-        # Sort by priority and return first with passes=false
-        stories: list[dict[str, Any]] = self._prd_data.get("userStories", [])
-        stories_sorted = sorted(stories, key=lambda s: s.get("priority", 999))
+        stories = self._stories_by_priority
+        if stories is None:
+            stories = sorted(
+                self._prd_data.get("userStories", []), key=lambda s: s.get("priority", 999)
+            )
+            self._stories_by_priority = stories
 
-        for story in stories_sorted:
-            if not story.get("passes", False):
-                return story
-        return None
+        # Stories only ever become passed, so the cursor never moves back
+        pos = self._next_story_pos
+        while pos < len(stories) and stories[pos].get("passes", False):
+            pos += 1
+        self._next_story_pos = pos
+        return stories[pos] if pos < len(stories) else None
 
     def get_remaining_count(self) -> int:
         """Get count of stories with passes=false.
@@ -180,22 +326,46 @@ class BuildLoop:
         if self._prd_data is None:
             return 0
 
-        return sum(
-            1 for s in self._prd_data.get("userStories", [])
-            if not s.get("passes", False)
-        )
+        return self._remaining
+
+    def _index_stories(self, stories: list[dict[str, Any]]) -> None:
+        """Build the story lookups used by the bookkeeping methods.
+
+        Args:
+            stories: The PRD's userStories list.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        for story in stories:
+            story_id = story.get("id")
+            # The first story with an ID wins, as with a linear search; lookups
+            # are by str ID, so stories without one can't be found anyway
+            if isinstance(story_id, str):
+                index.setdefault(story_id, story)
+        self._story_index = index
+        self._stories_by_priority = None
+        self._next_story_pos = 0
+        self._remaining = sum(1 for s in stories if not s.get("passes", False))
 
     def implement_story(
-        self, story_data: dict[str, Any]
+        self,
+        story_data: dict[str, Any],
+        developer: DeveloperAgent | None = None,
+        qa: QATesterAgent | None = None,
     ) -> tuple[bool, list[str], str]:
         """Implement a single story using Developer and QA agents.
 
         Args:
             story_data: Story dict from prd.json.
+            developer: Developer agent to use instead of developer_agent.
+            qa: QA agent to use instead of qa_agent.
 
         Returns:
             Tuple of (success, written_files, failure_reason).
         """
+        if developer is None:
+            developer = self.developer_agent
+        if qa is None:
+            qa = self.qa_agent
         story_id = story_data.get("id", "unknown")
         story_title = story_data.get("title", "untitled")
 
@@ -206,7 +376,7 @@ class BuildLoop:
 
         try:
             # Implementation phase
-            written_files = self.developer_agent.implement_story(story)
+            written_files = developer.implement_story(story)
             log_agent_action(
                 "BuildLoop",
                 "Files written",
@@ -214,33 +384,38 @@ class BuildLoop:
             )
         except Exception as e:
             reason = f"Implementation failed: {e}"
-            logger.error(f"[BuildLoop] {story_id} - {reason}")
+            logger.error("[BuildLoop] %s - %s", story_id, reason)
             return False, [], reason
 
         try:
             # Verification phase
-            report = self.qa_agent.verify_story(story_data, written_files)
+            report = qa.verify_story(story_data, written_files)
 
             if report.overall_passed:
                 log_agent_action("BuildLoop", "Verification passed", story_id)
                 return True, written_files, ""
             else:
                 reason = f"Verification failed: {report.summary}"
-                logger.warning(f"[BuildLoop] {story_id} - {reason}")
+                logger.warning("[BuildLoop] %s - %s", story_id, reason)
                 return False, written_files, reason
 
         except Exception as e:
             reason = f"Verification error: {e}"
-            logger.error(f"[BuildLoop] {story_id} - {reason}")
+            logger.error("[BuildLoop] %s - %s", story_id, reason)
             return False, written_files, reason
 
     def run_story_with_retries(
-        self, story_data: dict[str, Any]
+        self,
+        story_data: dict[str, Any],
+        developer: DeveloperAgent | None = None,
+        qa: QATesterAgent | None = None,
     ) -> tuple[bool, list[str]]:
         """Run a story implementation with retry logic.
 
         Args:
             story_data: Story dict from prd.json.
+            developer: Developer agent to use instead of developer_agent.
+            qa: QA agent to use instead of qa_agent.
 
         Returns:
             Tuple of (success, written_files).
@@ -255,21 +430,23 @@ class BuildLoop:
                 story_id,
             )
 
-            success, written_files, failure_reason = self.implement_story(story_data)
+            success, written_files, failure_reason = self.implement_story(
+                story_data, developer, qa
+            )
 
             if success:
                 return True, written_files
 
             failure_reasons.append(f"Attempt {attempt}: {failure_reason}")
-
-            # Clear agent state for retry
-            self.developer_agent.clear_history()
-            self.qa_agent.reset()
+            # No agent reset needed before the retry: both agents' set_story
+            # clears their state and history at the start of each attempt
 
         # All retries exhausted
-        all_reasons = "; ".join(failure_reasons)
         logger.error(
-            f"[BuildLoop] {story_id} failed after {self.max_retries} attempts: {all_reasons}"
+            "[BuildLoop] %s failed after %d attempts: %s",
+            story_id,
+            self.max_retries,
+            "; ".join(failure_reasons),
         )
         return False, []
 
@@ -281,11 +458,209 @@ class BuildLoop:
         """
         return self.scrum_master.should_continue_build(self.max_retries)
 
+    def _run_sequential(
+        self,
+        progress: StoryProgress,
+        failed_story_ids: list[str],
+        errors: list[str],
+    ) -> int:
+        """Implement pending stories one at a time, as the Scrum Master orders them.
+
+        Args:
+            progress: Progress tracker for the build.
+            failed_story_ids: Collects the IDs of stories that failed.
+            errors: Collects error messages.
+
+        Returns:
+            Number of stories that passed.
+        """
+        completed = 0
+        while True:
+            # Get next story to work on
+            story = self.scrum_master.get_next_story()
+
+            if story is None:
+                # No more pending stories
+                break
+
+            story_id = story.id
+            story_title = story.title
+
+            # Check if this story should be skipped
+            if story.status == StoryStatus.FAILED and story.attempt_count >= self.max_retries:
+                log_agent_action("BuildLoop", "Skipping failed story", story_id)
+                continue
+
+            progress.begin_story(story_id, story_title)
+
+            # Get the story data from PRD
+            story_data = self._story_index.get(story_id)
+
+            if story_data is None:
+                logger.error("[BuildLoop] Story %s not found in PRD", story_id)
+                self.scrum_master.mark_story_failed(story_id, "Story not found in PRD")
+                progress.fail_story("Story not found in PRD")
+                failed_story_ids.append(story_id)
+                continue
+
+            # Implement the story with retries
+            success, written_files = self.run_story_with_retries(story_data)
+
+            if success:
+                # Mark as passed and commit
+                self.mark_story_passed(story_id)
+                self.scrum_master.mark_story_completed(story_id)
+                progress.complete_story()
+                completed += 1
+
+                # Auto-commit the changes
+                auto_commit_story(story_id, story_title, written_files)
+            else:
+                # Mark as failed
+                self.scrum_master.mark_story_failed(
+                    story_id, f"Failed after {self.max_retries} attempts"
+                )
+                progress.fail_story(f"Failed after {self.max_retries} attempts")
+                failed_story_ids.append(story_id)
+                errors.append(f"{story_id}: Failed after {self.max_retries} attempts")
+
+            # Check if we should continue
+            if not self.should_continue():
+                log_agent_action(
+                    "BuildLoop",
+                    "Stopping",
+                    "All remaining stories have failed",
+                )
+                break
+
+        return completed
+
+    def _run_parallel(
+        self,
+        progress: StoryProgress,
+        workers: int,
+        failed_story_ids: list[str],
+        errors: list[str],
+    ) -> int:
+        """Implement independent pending stories concurrently.
+
+        Used when at least one story declares dependencies. A story starts
+        once every story in its dependencies has passed; ready stories start
+        in priority order. A story that doesn't declare dependencies depends
+        on the story before it in priority order.
+
+        Each running story gets its own Developer and QA agents, while PRD
+        bookkeeping, Scrum Master updates and commits stay on this thread.
+        A commit stages only the files its story wrote, so it never picks up
+        those of stories still in flight.
+        Stories whose dependencies never pass (they failed, don't exist, or
+        form a cycle) are reported as blocked.
+
+        Args:
+            progress: Progress tracker for the build.
+            workers: Maximum number of stories in flight.
+            failed_story_ids: Collects the IDs of failed and blocked stories.
+            errors: Collects error messages.
+
+        Returns:
+            Number of stories that passed.
+        """
+        if self._prd_data is None:
+            return 0
+
+        stories = self._prd_data.get("userStories", [])
+        passed = {s.get("id") for s in stories if s.get("passes", False)}
+        pending: list[tuple[dict[str, Any], list[str]]] = []
+        previous_id: str | None = None
+        for story_data in sorted(stories, key=lambda s: s.get("priority", 999)):
+            dependencies = UserStory.from_dict(story_data).dependencies
+            if dependencies is None:
+                dependencies = [] if previous_id is None else [previous_id]
+            if not story_data.get("passes", False):
+                pending.append((story_data, dependencies))
+            previous_id = story_data.get("id", "unknown")
+
+        # Agents hold per-story state, so each story in flight needs its own
+        agents: queue.SimpleQueue[tuple[DeveloperAgent, QATesterAgent]] = queue.SimpleQueue()
+        agents.put((self.developer_agent, self.qa_agent))
+        for _ in range(workers - 1):
+            agents.put(
+                (
+                    DeveloperAgent(client=self.developer_agent.client),
+                    QATesterAgent(client=self.qa_agent.client),
+                )
+            )
+
+        def run_story(story_data: dict[str, Any]) -> tuple[bool, list[str]]:
+            developer, qa = agents.get()
+            try:
+                return self.run_story_with_retries(story_data, developer, qa)
+            finally:
+                agents.put((developer, qa))
+
+        completed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight: dict[Future[tuple[bool, list[str]]], dict[str, Any]] = {}
+            while True:
+                waiting = []
+                for story_data, dependencies in pending:
+                    if len(in_flight) < workers and all(d in passed for d in dependencies):
+                        progress.begin_story(
+                            story_data.get("id", "unknown"), story_data.get("title", "untitled")
+                        )
+                        in_flight[executor.submit(run_story, story_data)] = story_data
+                    else:
+                        waiting.append((story_data, dependencies))
+                pending = waiting
+
+                if not in_flight:
+                    break  # done, or the rest wait on stories that won't pass
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    story_data = in_flight.pop(future)
+                    story_id = story_data.get("id", "unknown")
+                    success, written_files = future.result()
+
+                    if success:
+                        self.mark_story_passed(story_id)
+                        self.scrum_master.mark_story_completed(story_id)
+                        progress.complete_story(story_id)
+                        completed += 1
+                        passed.add(story_id)
+                        # With no files listed auto_commit_story would stage
+                        # everything, including files of stories still in flight
+                        if written_files:
+                            auto_commit_story(
+                                story_id, story_data.get("title", "untitled"), written_files
+                            )
+                        else:
+                            logger.info("[BuildLoop] No files to commit for %s", story_id)
+                    else:
+                        reason = f"Failed after {self.max_retries} attempts"
+                        self.scrum_master.mark_story_failed(story_id, reason)
+                        progress.fail_story(reason, story_id)
+                        failed_story_ids.append(story_id)
+                        errors.append(f"{story_id}: {reason}")
+
+        for story_data, dependencies in pending:
+            story_id = story_data.get("id", "unknown")
+            unmet = ", ".join(d for d in dependencies if d not in passed)
+            reason = f"Blocked by unmet dependencies: {unmet}"
+            self.scrum_master.mark_story_blocked(story_id, reason)
+            progress.fail_story(reason, story_id)
+            failed_story_ids.append(story_id)
+            errors.append(f"{story_id}: {reason}")
+
+        return completed
+
     def run(self) -> BuildResult:
         """Run the autonomous build loop.
 
         Iterates through all stories with passes=false, implementing and
         verifying each one. Retries failed stories up to max_retries times.
+        With parallel_builds above 1, independent stories run concurrently
+        if the PRD declares story dependencies.
 
         Returns:
             BuildResult with final status and statistics.
@@ -294,7 +669,7 @@ class BuildLoop:
         try:
             prd_data = self.load_prd()
         except PRDLoadError as e:
-            logger.error(f"[BuildLoop] Failed to load PRD: {e}")
+            logger.error("[BuildLoop] Failed to load PRD: %s", e)
             return BuildResult(
                 success=False,
                 total_stories=0,
@@ -323,68 +698,24 @@ class BuildLoop:
         errors: list[str] = []
 
         with progress:
-            while True:
-                # Get next story to work on
-                story = self.scrum_master.get_next_story()
-
-                if story is None:
-                    # No more pending stories
-                    break
-
-                story_id = story.id
-                story_title = story.title
-
-                # Check if this story should be skipped
-                if story.status == StoryStatus.FAILED and story.attempt_count >= self.max_retries:
-                    log_agent_action("BuildLoop", "Skipping failed story", story_id)
-                    continue
-
-                progress.begin_story(story_id, story_title)
-
-                # Get the story data from PRD
-                story_data: dict[str, Any] | None = None
-                if self._prd_data is not None:
-                    for s in self._prd_data.get("userStories", []):
-                        if s.get("id") == story_id:
-                            story_data = s
-                            break
-
-                if story_data is None:
-                    logger.error(f"[BuildLoop] Story {story_id} not found in PRD")
-                    self.scrum_master.mark_story_failed(story_id, "Story not found in PRD")
-                    progress.fail_story("Story not found in PRD")
-                    failed_story_ids.append(story_id)
-                    continue
-
-                # Implement the story with retries
-                success, written_files = self.run_story_with_retries(story_data)
-
-                if success:
-                    # Mark as passed and commit
-                    self.mark_story_passed(story_id)
-                    self.scrum_master.mark_story_completed(story_id)
-                    progress.complete_story()
-                    completed_count += 1
-
-                    # Auto-commit the changes
-                    auto_commit_story(story_id, story_title, written_files)
-                else:
-                    # Mark as failed
-                    self.scrum_master.mark_story_failed(
-                        story_id, f"Failed after {self.max_retries} attempts"
-                    )
-                    progress.fail_story(f"Failed after {self.max_retries} attempts")
-                    failed_story_ids.append(story_id)
-                    errors.append(f"{story_id}: Failed after {self.max_retries} attempts")
-
-                # Check if we should continue
-                if not self.should_continue():
-                    log_agent_action(
-                        "BuildLoop",
-                        "Stopping",
-                        "All remaining stories have failed",
-                    )
-                    break
+            workers = _build_concurrency()
+            # Converted PRDs declare no dependencies, only an order, so they
+            # build one story at a time just like with parallel_builds=1
+            declares_dependencies = any(
+                UserStory.from_dict(s).dependencies is not None
+                for s in prd_data.get("userStories", [])
+            )
+            if workers > 1 and declares_dependencies:
+                completed_count += self._run_parallel(
+                    progress, workers, failed_story_ids, errors
+                )
+            else:
+                completed_count += self._run_sequential(progress, failed_story_ids, errors)
+
+        # Fold journaled passes into prd.json (if the run is interrupted
+        # instead, the next load_prd does this)
+        if self._dirty:
+            self.save_prd()
 
         # Log completion
         log_build_complete(progress)
@@ -4,8 +4,12 @@ Provides sandboxed file operations limited to the configured project directory.
 """
 
 import fnmatch
+import functools
 import logging
 import os
+import re
+import stat
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -29,33 +33,67 @@ BINARY_EXTENSIONS = frozenset({
 })
 
 
+# Locks serializing write_file calls per directory, for agents writing
+# files concurrently (e.g. parallel builds)
+_write_locks: dict[Path, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
 class FileOpsError(Exception):
     """Base exception for file operations errors."""
 
 
-def _get_project_dir() -> Path:
-    """Get the configured project directory."""
-    settings = get_settings()
-    return Path(settings.project_dir).resolve()
+@functools.lru_cache(maxsize=8)
+def _resolve_dir(project_dir: str) -> Path:
+    """Resolve a project directory (memoized: resolve() stats each path component)."""
+    return Path(project_dir).resolve()
+
+
+def _get_project_dir(project_dir: Optional[str | Path] = None) -> Path:
+    """Get the resolved project directory.
 
+    Args:
+        project_dir: Optional override; defaults to the configured directory.
+    """
+    return _resolve_dir(str(project_dir) if project_dir else get_settings().project_dir)
 
-def _is_path_safe(path: Path, project_dir: Path) -> bool:
+
+def _is_path_safe(resolved: Path, project_dir: Path) -> bool:
     """Check if a path is safe (within project directory).
 
-    Rejects paths with '..' or absolute paths outside project directory.
+    The path must already be resolved, so neither '..' nor symlinks can
+    lead outside the project directory unnoticed.
     """
-    try:
-        resolved = path.resolve()
-        # Check if resolved path is within project directory
-        resolved.relative_to(project_dir)
-        return True
-    except ValueError:
-        return False
+    path_str = os.path.normcase(str(resolved))
+    proj_str = os.path.normcase(str(project_dir))
+    return path_str == proj_str or path_str.startswith(proj_str.rstrip(os.sep) + os.sep)
+
+
+def _is_binary_file(name: str) -> bool:
+    """Check if a file appears to be binary based on its name's extension.
+
+    Equivalent to checking PurePath(name).suffix, without the Path machinery.
+    """
+    i = name.rfind(".")
+    # A leading dot starts a hidden name, not an extension
+    return i > 0 and name[i:].lower() in BINARY_EXTENSIONS
+
+
+def _dir_write_lock(directory: Path) -> threading.Lock:
+    """Get the lock that serializes writes into a directory."""
+    with _write_locks_guard:
+        lock = _write_locks.get(directory)
+        if lock is None:
+            lock = _write_locks[directory] = threading.Lock()
+        return lock
+
 
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a single-component glob once, matching as fnmatch.fnmatch does.
 
-def _is_binary_file(path: Path) -> bool:
-    """Check if a file appears to be binary based on extension."""
-    return path.suffix.lower() in BINARY_EXTENSIONS
+    Names must be passed through os.path.normcase before matching.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
 
 
 def read_file(path: str | Path, project_dir: Optional[str | Path] = None) -> str:
@@ -71,50 +109,60 @@ def read_file(path: str | Path, project_dir: Optional[str | Path] = None) -> str
     Raises:
         FileOpsError: If path is outside project directory or other safety violation
     """
-    proj_dir = Path(project_dir).resolve() if project_dir else _get_project_dir()
+    proj_dir = _get_project_dir(project_dir)
     file_path = Path(path)
 
     # Make path absolute relative to project dir if not already absolute
     if not file_path.is_absolute():
         file_path = proj_dir / file_path
 
-    # Security check: ensure path is within project directory
-    if not _is_path_safe(file_path, proj_dir):
+    # Security check: ensure path is within project directory (resolved once,
+    # for both the check and the access)
+    resolved_path = file_path.resolve()
+    if not _is_path_safe(resolved_path, proj_dir):
         raise FileOpsError(
             f"Access denied: path '{path}' is outside project directory '{proj_dir}'"
         )
 
-    resolved_path = file_path.resolve()
-
-    # Check if file exists
-    if not resolved_path.exists():
-        logger.warning(f"File not found: {resolved_path}")
+    # Check for binary files (by extension, so before any further I/O)
+    if _is_binary_file(resolved_path.name):
+        logger.warning("Skipping binary file: %s", resolved_path)
         return ""
 
-    # Check if it's a file (not directory)
-    if not resolved_path.is_file():
-        logger.warning(f"Path is not a file: {resolved_path}")
+    # One stat serves the existence, file type and size checks
+    try:
+        st = resolved_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        logger.warning("File not found: %s", resolved_path)
         return ""
 
-    # Check for binary files
-    if _is_binary_file(resolved_path):
-        logger.warning(f"Skipping binary file: {resolved_path}")
+    # Check if it's a file (not directory)
+    if not stat.S_ISREG(st.st_mode):
+        logger.warning("Path is not a file: %s", resolved_path)
         return ""
 
     # Check file size
-    file_size = resolved_path.stat().st_size
+    file_size = st.st_size
     if file_size > MAX_FILE_SIZE:
         raise FileOpsError(
             f"File too large: {resolved_path} ({file_size} bytes > {MAX_FILE_SIZE} bytes)"
         )
 
+    # Read the bytes in one sized read and decode once, rather than through
+    # a streaming text wrapper
+    with open(resolved_path, "rb") as f:
+        data = f.read()
     try:
-        with open(resolved_path, "r", encoding="utf-8") as f:
-            return f.read()
+        content = data.decode("utf-8")
     except UnicodeDecodeError:
-        logger.warning(f"Skipping binary file (decode error): {resolved_path}")
+        logger.warning("Skipping binary file (decode error): %s", resolved_path)
         return ""
 
+    # Same newline translation as text mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
 
 def write_file(
     path: str | Path,
@@ -136,28 +184,29 @@ def write_file(
     Raises:
         FileOpsError: If path is outside project directory
     """
-    proj_dir = Path(project_dir).resolve() if project_dir else _get_project_dir()
+    proj_dir = _get_project_dir(project_dir)
     file_path = Path(path)
 
     # Make path absolute relative to project dir if not already absolute
     if not file_path.is_absolute():
         file_path = proj_dir / file_path
 
-    # Security check: ensure path is within project directory
-    if not _is_path_safe(file_path, proj_dir):
+    # Security check: ensure path is within project directory (resolved once,
+    # for both the check and the access)
+    resolved_path = file_path.resolve()
+    if not _is_path_safe(resolved_path, proj_dir):
         raise FileOpsError(
             f"Access denied: path '{path}' is outside project directory '{proj_dir}'"
         )
 
-    resolved_path = file_path.resolve()
-
-    # Create parent directories if needed
-    resolved_path.parent.mkdir(parents=True, exist_ok=True)
+    with _dir_write_lock(resolved_path.parent):
+        # Create parent directories if needed
+        resolved_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(resolved_path, "w", encoding="utf-8") as f:
-        f.write(content)
+        with open(resolved_path, "w", encoding="utf-8") as f:
+            f.write(content)
 
-    logger.info(f"Wrote file: {resolved_path}")
+    logger.info("Wrote file: %s", resolved_path)
     return resolved_path
 
 
@@ -179,51 +228,49 @@ def list_files(
     Raises:
         FileOpsError: If directory is outside project directory
     """
-    proj_dir = Path(project_dir).resolve() if project_dir else _get_project_dir()
+    proj_dir = _get_project_dir(project_dir)
     search_dir = Path(directory)
 
     # Make path absolute relative to project dir if not already absolute
     if not search_dir.is_absolute():
         search_dir = proj_dir / search_dir
 
-    # Security check: ensure path is within project directory
-    if not _is_path_safe(search_dir, proj_dir):
+    # Security check: ensure path is within project directory (resolved once,
+    # for both the check and the listing)
+    resolved_dir = search_dir.resolve()
+    if not _is_path_safe(resolved_dir, proj_dir):
         raise FileOpsError(
             f"Access denied: directory '{directory}' is outside project directory '{proj_dir}'"
         )
 
-    resolved_dir = search_dir.resolve()
-
-    if not resolved_dir.exists():
-        logger.warning(f"Directory not found: {resolved_dir}")
+    # One stat serves the existence and directory checks
+    try:
+        dir_mode = resolved_dir.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        logger.warning("Directory not found: %s", resolved_dir)
         return []
 
-    if not resolved_dir.is_dir():
-        logger.warning(f"Path is not a directory: {resolved_dir}")
+    if not stat.S_ISDIR(dir_mode):
+        logger.warning("Path is not a directory: %s", resolved_dir)
         return []
 
-    # Collect matching files
+    # Collect matching files, as paths relative to the project directory
+    base = resolved_dir.relative_to(proj_dir)
     matching_files: list[Path] = []
 
     if "**" in pattern:
-        # Recursive glob
+        # Recursive glob. Path.glob only descends into directories matching
+        # the pattern's leading components, and follows symlinks the usual way
         for file_path in resolved_dir.glob(pattern):
             if file_path.is_file():
-                # Return path relative to project directory
-                try:
-                    relative_path = file_path.relative_to(proj_dir)
-                    matching_files.append(relative_path)
-                except ValueError:
-                    # Skip files outside project dir (shouldn't happen)
-                    pass
+                matching_files.append(base / file_path.relative_to(resolved_dir))
     else:
-        # Non-recursive: walk top-level only
-        for entry in resolved_dir.iterdir():
-            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
-                try:
-                    relative_path = entry.relative_to(proj_dir)
-                    matching_files.append(relative_path)
-                except ValueError:
-                    pass
+        # Non-recursive: top-level only. os.scandir's entries carry the file
+        # type from the directory listing, so most need no extra stat call
+        name_re = _compile_glob(pattern)
+        with os.scandir(resolved_dir) as it:
+            for entry in it:
+                if entry.is_file() and name_re.match(os.path.normcase(entry.name)):
+                    matching_files.append(base / entry.name)
 
     return sorted(matching_files)
@@ -111,20 +111,24 @@ def get_logger() -> logging.Logger:
     return logger
 
 
-def log_agent_action(agent_name: str, action: str, details: str = "") -> None:
+def log_agent_action(agent_name: str, action: str, details: str = "", *args: object) -> None:
     """
     Log an agent action with consistent formatting.
 
     Args:
         agent_name: Name of the agent performing the action.
         action: The action being performed (e.g., "thinking", "writing", "verifying").
-        details: Optional additional details about the action.
+        details: Optional additional details about the action. With args, a
+            %-style format string that is only formatted if the record is emitted.
+        *args: Arguments for a %-style details string.
     """
     logger = get_logger()
-    message = f"[{agent_name}] {action}"
-    if details:
-        message += f": {details}"
-    logger.info(message)
+    if args:
+        logger.info("[%s] %s: " + details, agent_name, action, *args)
+    elif details:
+        logger.info("[%s] %s: %s", agent_name, action, details)
+    else:
+        logger.info("[%s] %s", agent_name, action)
 
 
 def log_agent_decision(agent_name: str, decision: str, reasoning: str = "") -> None:
@@ -223,37 +227,50 @@ class StoryProgress:
             )
         log_agent_action("Build", "Starting story", f"{story_id} - {story_title}")
 
-    def complete_story(self) -> None:
-        """Mark current story as completed."""
+    def complete_story(self, story_id: str = "") -> None:
+        """
+        Mark a story as completed.
+
+        Args:
+            story_id: The story, if not the current one (as when stories
+                run in parallel).
+        """
+        story_id = story_id or self.current_story_id
         self.completed_stories += 1
         if self._progress is not None and self._task_id is not None:
             self._progress.update(self._task_id, advance=1)
         log_agent_action(
             "Build",
             "Completed story",
-            f"{self.current_story_id} ({self.completed_stories}/{self.total_stories})",
+            f"{story_id} ({self.completed_stories}/{self.total_stories})",
         )
-        self.current_story_id = ""
-        self.current_story_title = ""
+        self._end_story(story_id)
 
-    def fail_story(self, reason: str = "") -> None:
+    def fail_story(self, reason: str = "", story_id: str = "") -> None:
         """
-        Mark current story as failed.
+        Mark a story as failed.
 
         Args:
             reason: Optional reason for failure.
+            story_id: The story, if not the current one.
         """
-        if self.current_story_id:
-            self.failed_stories.append(self.current_story_id)
+        story_id = story_id or self.current_story_id
+        if story_id:
+            self.failed_stories.append(story_id)
         if self._progress is not None and self._task_id is not None:
             self._progress.update(self._task_id, advance=1)
         logger = get_logger()
-        message = f"Failed story {self.current_story_id}"
+        message = f"Failed story {story_id}"
         if reason:
             message += f": {reason}"
         logger.error(message)
-        self.current_story_id = ""
-        self.current_story_title = ""
+        self._end_story(story_id)
+
+    def _end_story(self, story_id: str) -> None:
+        """Clear the current story if it is the one that ended."""
+        if story_id == self.current_story_id:
+            self.current_story_id = ""
+            self.current_story_title = ""
 
     def get_summary(self) -> str:
         """
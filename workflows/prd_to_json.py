@@ -52,6 +52,26 @@ class StoryData:
             "notes": self.notes,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StoryData":
+        """Create a story from its prd.json dictionary form.
+
+        Args:
+            data: Dictionary with camelCase keys, as produced by to_dict().
+
+        Returns:
+            The StoryData instance.
+        """
+        return cls(
+            id=str(data.get("id", "")),
+            title=str(data.get("title", "")),
+            description=str(data.get("description", "")),
+            acceptance_criteria=list(data.get("acceptanceCriteria", [])),
+            priority=int(data.get("priority", 0)),
+            passes=bool(data.get("passes", False)),
+            notes=str(data.get("notes", "")),
+        )
+
 
 @dataclass
 class PRDJson:
@@ -82,6 +102,23 @@ class PRDJson:
             "userStories": [s.to_dict() for s in self.user_stories],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PRDJson":
+        """Create a PRD from its prd.json dictionary form.
+
+        Args:
+            data: Dictionary as produced by to_dict().
+
+        Returns:
+            The PRDJson instance.
+        """
+        return cls(
+            project=str(data.get("project", "")),
+            branch_name=str(data.get("branchName", "")),
+            description=str(data.get("description", "")),
+            user_stories=[StoryData.from_dict(s) for s in data.get("userStories", [])],
+        )
+
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string.
 
@@ -351,6 +388,32 @@ class PRDToJsonConverter:
 
         return content
 
+    def load_json(self, path: str | None = None) -> PRDJson:
+        """Load a previously converted prd.json.
+
+        Args:
+            path: Optional override for output path.
+
+        Returns:
+            The loaded PRDJson, also stored as self.prd_json.
+
+        Raises:
+            ValueError: If the file is missing, empty or not valid prd.json.
+        """
+        json_path = path or self.output_path
+
+        content = read_file(json_path)
+        if not content:
+            raise ValueError(f"prd.json is empty or doesn't exist: {json_path}")
+
+        try:
+            data = json.loads(content)
+            self.prd_json = PRDJson.from_dict(data)
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid prd.json at {json_path}: {e}") from e
+
+        return self.prd_json
+
     def parse(self, content: str | None = None, path: str | None = None) -> PRDJson:
         """Parse PRD markdown into JSON structure.
 